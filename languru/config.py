@@ -7,6 +7,7 @@ from rich.console import Console
 class Settings(BaseSettings):
     logger_name: str = "languru"
     debug: bool = True
+    openai_num_parallel: int = 4
 
 
 settings = Settings()
@@ -1,5 +1,7 @@
+import functools
 import json
 import time
+from concurrent.futures import ThreadPoolExecutor
 from itertools import chain
 from textwrap import dedent
 from typing import (
@@ -20,6 +22,7 @@ from typing import (
 
 import duckdb
 import jinja2
+import orjson
 from rich.text import Text as RichText
 
 import languru.exceptions
@@ -37,10 +40,16 @@ from languru.utils.sql import (
 )
 
 if TYPE_CHECKING:
-    import pandas as pd
     from openai import OpenAI
-
-    from languru.documents.document import Document, Point, PointWithScore, SearchResult
+    from pydantic import BaseModel
+
+    from languru.documents.document import (
+        Document,
+        Point,
+        PointBatch,
+        PointWithScore,
+        SearchResult,
+    )
     from languru.types.rerank import RerankingObject
 
 sql_stmt_show_tables = "SHOW TABLES"
@@ -50,37 +59,108 @@ sql_stmt_vector_search = dedent(
     WITH vector_search AS (
         SELECT {{ columns_expr }}
         FROM {{ table_name }}
-        ORDER BY relevance_score DESC
+        ORDER BY distance
         LIMIT {{ top_k }}
     )
-    SELECT p.*
-    FROM vector_search p
+    SELECT * EXCLUDE (distance), 1 - distance AS relevance_score
+    FROM vector_search
+    ORDER BY distance
     """
 ).strip()
-sql_stmt_vector_search_with_documents = dedent(
+sql_stmt_remove_outdated_points = dedent(
     """
-    WITH vector_search AS (
+    DELETE FROM {{ table_name }} WHERE document_id = ? AND content_md5 != ?
+    """
+).strip()
+sql_stmt_get_by_doc_ids = dedent(
+    """
+    SELECT {{ columns_expr }} FROM {{ table_name }} WHERE document_id IN ( {{ placeholders }} )
+    """  # noqa: E501
+).strip()
+sql_stmt_vector_search_binary = dedent(
+    """
+    WITH candidates AS (
+        SELECT point_id
+        FROM {{ table_name }}
+        ORDER BY bit_count(xor(embedding_bits, ?::BIT)) ASC
+        LIMIT {{ rescore_top_k }}
+    ), vector_search AS (
         SELECT {{ columns_expr }}
         FROM {{ table_name }}
-        ORDER BY relevance_score DESC
+        WHERE point_id IN (SELECT point_id FROM candidates)
+        ORDER BY distance
         LIMIT {{ top_k }}
     )
-    SELECT p.*, d.*
-    FROM vector_search p
-    JOIN {{ document_table_name }} d ON p.document_id = d.document_id
-    ORDER BY p.relevance_score DESC
+    SELECT * EXCLUDE (distance), 1 - distance AS relevance_score
+    FROM vector_search
+    ORDER BY distance
     """
 ).strip()
-sql_stmt_remove_outdated_points = dedent(
+sql_stmt_add_embedding_bits = dedent(
     """
-    DELETE FROM {{ table_name }} WHERE document_id = ? AND content_md5 != ?
+    ALTER TABLE {{ table_name }} ADD COLUMN IF NOT EXISTS embedding_bits BIT
     """
 ).strip()
-sql_stmt_get_by_doc_ids = dedent(
+sql_stmt_update_embedding_bits = dedent(
     """
-    SELECT {{ columns_expr }} FROM {{ table_name }} WHERE document_id IN ( {{ placeholders }} )
+    UPDATE {{ table_name }}
+    SET embedding_bits = array_to_string(
+        list_transform(embedding::FLOAT[], x -> CASE WHEN x > 0 THEN '1' ELSE '0' END), ''
+    )::BIT
+    WHERE embedding_bits IS NULL
     """  # noqa: E501
 ).strip()
+sql_stmt_documents_stale_points = dedent(
+    """
+    SELECT
+        d.document_id,
+        COUNT(p.point_id) FILTER (WHERE p.content_md5 != d.content_md5) AS stale,
+        COUNT(p.point_id) AS total
+    FROM (VALUES {{ placeholders }}) AS d(document_id, content_md5)
+    LEFT JOIN {{ table_name }} p ON p.document_id = d.document_id
+    GROUP BY d.document_id
+    """
+).strip()
+sql_tmpl_drop_table = jinja2.Template(sql_stmt_drop_table)
+sql_tmpl_vector_search = jinja2.Template(sql_stmt_vector_search)
+sql_tmpl_vector_search_binary = jinja2.Template(sql_stmt_vector_search_binary)
+sql_tmpl_add_embedding_bits = jinja2.Template(sql_stmt_add_embedding_bits)
+sql_tmpl_update_embedding_bits = jinja2.Template(sql_stmt_update_embedding_bits)
+sql_tmpl_remove_outdated_points = jinja2.Template(sql_stmt_remove_outdated_points)
+sql_tmpl_get_by_doc_ids = jinja2.Template(sql_stmt_get_by_doc_ids)
+sql_tmpl_documents_stale_points = jinja2.Template(sql_stmt_documents_stale_points)
+
+
+@functools.lru_cache(maxsize=64)
+def render_vector_search_query(
+    *,
+    table_name: Text,
+    columns_expr: Text,
+    top_k: int,
+    rescore_top_k: Optional[int] = None,
+) -> Text:
+    """Render the vector search query, cached as the inputs are class constants.
+
+    With `rescore_top_k`, candidates are first ranked by the Hamming distance of
+    the binary quantized embeddings and only those are rescored by cosine.
+    """
+
+    if rescore_top_k is not None:
+        return sql_tmpl_vector_search_binary.render(
+            table_name=table_name,
+            columns_expr=columns_expr,
+            top_k=top_k,
+            rescore_top_k=rescore_top_k,
+        )
+    return sql_tmpl_vector_search.render(
+        table_name=table_name, columns_expr=columns_expr, top_k=top_k
+    )
+
+
+def embedding_to_bits(embedding: Sequence[float]) -> Text:
+    """Return the sign bits of an embedding as a DuckDB BIT string literal."""
+
+    return "".join("1" if x > 0 else "0" for x in embedding)
 
 
 def show_tables(conn: "duckdb.DuckDBPyConnection") -> Tuple[Text, ...]:
@@ -103,6 +183,34 @@ def install_all_extensions(conn: "duckdb.DuckDBPyConnection") -> None:
     install_json_extension(conn=conn)
 
 
+@functools.lru_cache(maxsize=None)
+def model_columns(model: Type["BaseModel"]) -> Tuple[Text, ...]:
+    """Return the table columns of the model, computed once per model class."""
+
+    return tuple(model.model_json_schema()["properties"].keys())
+
+
+@functools.lru_cache(maxsize=None)
+def vector_search_columns_expr(
+    point_model: Type["Point"], *, with_embedding: bool
+) -> Text:
+    """Return the select expression of the vector search, including the distance.
+
+    Ordering by `array_cosine_distance` is the form the VSS extension rewrites
+    into an HNSW index scan, the score is derived from it as `1 - distance`.
+    """
+
+    point_columns = [
+        c for c in model_columns(point_model) if with_embedding or c != "embedding"
+    ]
+    point_columns.append(
+        "array_cosine_distance("
+        + f"embedding, ?::FLOAT[{point_model.EMBEDDING_DIMENSIONS}]"
+        + ") AS distance"
+    )
+    return ", ".join(point_columns)
+
+
 class PointQuerySet:
     def __init__(
         self,
@@ -170,6 +278,7 @@ class PointQuerySet:
         # Check if table exists
         is_table_exists = self.model.TABLE_NAME in show_tables(conn=conn)
         if is_table_exists and not drop:
+            self.touch_embedding_bits(conn=conn, debug=debug)
             return True
         elif is_table_exists and drop:
             self.drop(conn=conn, force=force, debug=debug)
@@ -209,6 +318,7 @@ class PointQuerySet:
             # CREATE INDEX idx_points_embedding ON points USING HNSW(embedding) WITH (metric = 'cosine');  # noqa: E501
 
         conn.sql(create_table_sql)
+        self.touch_embedding_bits(conn=conn, debug=debug)
 
         if time_start is not None:
             time_end = time.perf_counter()
@@ -218,6 +328,47 @@ class PointQuerySet:
             )
         return True
 
+    def touch_embedding_bits(
+        self, *, conn: "duckdb.DuckDBPyConnection", debug: bool = False
+    ) -> bool:
+        """
+        Ensure the binary quantized embedding column exists and is filled.
+
+        This is a no-op unless the model sets `EMBEDDING_QUANTIZATION = "binary"`.
+        The `embedding_bits` column holds the sign of every embedding dimension
+        as a BIT string, 1/32 the size of the FLOAT embedding, and is used as the
+        first, coarse phase of `DocumentQuerySet.search_vector`.
+
+        Parameters
+        ----------
+        conn : duckdb.DuckDBPyConnection
+            The DuckDB connection object to use for database operations.
+        debug : bool, optional
+            If True, print debug information including SQL queries.
+            Default is False.
+
+        Returns
+        -------
+        bool
+            True if the model uses binary quantization, False otherwise.
+        """
+
+        if self.model.EMBEDDING_QUANTIZATION != "binary":
+            return False
+
+        query = (
+            sql_tmpl_add_embedding_bits.render(table_name=self.model.TABLE_NAME)
+            + ";\n"
+            + sql_tmpl_update_embedding_bits.render(table_name=self.model.TABLE_NAME)
+        )
+        if debug:
+            console.print(
+                "\nUpdating embedding bits with SQL:\n"
+                + f"{DISPLAY_SQL_QUERY.format(sql=query)}\n"
+            )
+        conn.sql(query)
+        return True
+
     def retrieve(
         self,
         point_id: Text,
@@ -269,7 +420,7 @@ class PointQuerySet:
         time_start = time.perf_counter() if debug else None
 
         # Get columns
-        columns = list(self.model.model_json_schema()["properties"].keys())
+        columns = list(model_columns(self.model))
         if not with_embedding:
             columns = [c for c in columns if c != "embedding"]
         columns_expr = ",".join(columns)
@@ -289,7 +440,7 @@ class PointQuerySet:
             raise NotFound(f"Point with ID '{point_id}' not found.")
 
         data = dict(zip([c for c in columns], result))
-        out = self.model.model_validate(data)
+        out = self.model.model_construct(**data)
 
         if time_start is not None:
             time_end = time.perf_counter()
@@ -401,7 +552,7 @@ class PointQuerySet:
                 )
 
         # Get columns
-        columns = list(points[0].model_json_schema()["properties"].keys())
+        columns = list(model_columns(type(points[0])))
         columns_expr = ", ".join(columns)
         placeholders = ", ".join(["?" for _ in columns])
         parameters: List[Tuple[Any, ...]] = []
@@ -422,6 +573,7 @@ class PointQuerySet:
 
         # Create points
         conn.executemany(query, parameters)
+        self.touch_embedding_bits(conn=conn, debug=debug)
 
         if time_start is not None:
             time_end = time.perf_counter()
@@ -429,6 +581,72 @@ class PointQuerySet:
             console.print(f"Created {len(points)} points in {time_elapsed:.6f} ms")
         return points
 
+    def bulk_create_batch(
+        self,
+        batch: "PointBatch",
+        *,
+        conn: "duckdb.DuckDBPyConnection",
+        debug: bool = False,
+    ) -> "PointBatch":
+        """
+        Create the points of a PointBatch in the database.
+
+        The batch is registered with DuckDB as an Arrow table and inserted with a
+        single INSERT ... SELECT, so the embeddings are never converted to Python
+        floats.
+
+        Parameters
+        ----------
+        batch : PointBatch
+            The column-wise batch of embedded points to be created.
+        conn : duckdb.DuckDBPyConnection
+            The DuckDB connection object to use for database operations.
+        debug : bool, optional
+            If True, print debug information including SQL queries.
+            Default is False.
+
+        Returns
+        -------
+        PointBatch
+            The created batch.
+
+        See Also
+        --------
+        bulk_create : Method to create a sequence of Point objects.
+        """  # noqa: E501
+
+        time_start = time.perf_counter() if debug else None
+
+        if len(batch) == 0:
+            return batch
+
+        arrow_table = batch.to_arrow()
+        columns_expr = ", ".join(arrow_table.column_names)
+        view_name = "_point_batch"
+        query = (
+            f"INSERT INTO {self.model.TABLE_NAME} ({columns_expr}) "
+            + f"SELECT {columns_expr} FROM {view_name}"
+        )
+        if debug:
+            console.print(
+                "\nCreating points batch with SQL:\n"
+                + f"{DISPLAY_SQL_QUERY.format(sql=query)}\n"
+            )
+
+        # Create points
+        conn.register(view_name, arrow_table)
+        try:
+            conn.execute(query)
+        finally:
+            conn.unregister(view_name)
+        self.touch_embedding_bits(conn=conn, debug=debug)
+
+        if time_start is not None:
+            time_end = time.perf_counter()
+            time_elapsed = (time_end - time_start) * 1000
+            console.print(f"Created {len(batch)} points in {time_elapsed:.6f} ms")
+        return batch
+
     def update(self, *args, **kwargs):
         raise NotSupported("Updating points is not supported.")
 
@@ -550,7 +768,7 @@ class PointQuerySet:
 
         time_start = time.perf_counter() if debug else None
 
-        columns = list(self.model.model_json_schema()["properties"].keys())
+        columns = list(model_columns(self.model))
         if not with_embedding:
             columns = [c for c in columns if c != "embedding"]
         columns_expr = ",".join(columns)
@@ -588,12 +806,11 @@ class PointQuerySet:
                 + f"{DISPLAY_SQL_PARAMS.format(params=parameters)}\n"
             )
 
-        results_df: "pd.DataFrame" = (
-            conn.execute(query, parameters).fetch_arrow_table().to_pandas()
+        results: List[Dict] = (
+            conn.execute(query, parameters).fetch_arrow_table().to_pylist()
         )
-        results: List[Dict] = results_df.to_dict(orient="records")
 
-        points = [self.model.model_validate(row) for row in results[:limit]]
+        points = [self.model.model_construct(**row) for row in results[:limit]]
 
         out = OpenaiPage(
             data=points,
@@ -761,6 +978,64 @@ class PointQuerySet:
             console.print(f"Counted points in {time_elapsed:.6f} ms")
         return count
 
+    def any_stale(
+        self,
+        document_id: Text,
+        content_md5: Text,
+        *,
+        conn: "duckdb.DuckDBPyConnection",
+        debug: bool = False,
+    ) -> Optional[bool]:
+        """
+        Check whether any point of a document is out of date, in a single query.
+
+        Parameters
+        ----------
+        document_id : Text
+            The ID of the document whose points are checked.
+        content_md5 : Text
+            The current content hash of the document.
+        conn : duckdb.DuckDBPyConnection
+            The DuckDB connection object to use for database operations.
+        debug : bool, optional
+            If True, print debug information including SQL queries. Default is False.
+
+        Returns
+        -------
+        Optional[bool]
+            None if the document has no points, True if any point has a different
+            content_md5, False if all points are current.
+
+        See Also
+        --------
+        count : Method to count Point objects.
+        """
+
+        time_start = time.perf_counter() if debug else None
+
+        query = (
+            "SELECT COUNT(*) FILTER (WHERE content_md5 != ?) AS stale, "
+            + f"COUNT(*) AS total FROM {self.model.TABLE_NAME} WHERE document_id = ?"
+        )
+        parameters = [content_md5, document_id]
+        if debug:
+            console.print(
+                "\nChecking stale points with SQL:\n"
+                + f"{DISPLAY_SQL_QUERY.format(sql=query)}\n"
+                + f"{DISPLAY_SQL_PARAMS.format(params=parameters)}\n"
+            )
+
+        result = conn.execute(query, parameters).fetchone()
+        stale, total = result if result else (0, 0)
+
+        if time_start is not None:
+            time_end = time.perf_counter()
+            time_elapsed = (time_end - time_start) * 1000
+            console.print(f"Checked stale points in {time_elapsed:.6f} ms")
+        if total == 0:
+            return None
+        return stale > 0
+
     def drop(
         self,
         *,
@@ -807,8 +1082,7 @@ class PointQuerySet:
 
         time_start = time.perf_counter() if debug else None
 
-        query_template = jinja2.Template(sql_stmt_drop_table)
-        query = query_template.render(table_name=self.model.TABLE_NAME)
+        query = sql_tmpl_drop_table.render(table_name=self.model.TABLE_NAME)
         if debug:
             console.print(
                 f"\nDropping table: '{self.model.TABLE_NAME}' with SQL:\n"
@@ -869,8 +1143,7 @@ class PointQuerySet:
 
         time_start = time.perf_counter() if debug else None
 
-        query_template = jinja2.Template(sql_stmt_remove_outdated_points)
-        query = query_template.render(table_name=self.model.TABLE_NAME)
+        query = sql_tmpl_remove_outdated_points.render(table_name=self.model.TABLE_NAME)
         parameters = [document_id, content_md5]
 
         if debug:
@@ -1132,7 +1405,7 @@ class DocumentQuerySet:
 
         time_start = time.perf_counter() if debug else None
 
-        columns = list(self.model.model_json_schema()["properties"].keys())
+        columns = list(model_columns(self.model))
         if not with_embedding:
             columns = [c for c in columns if c != "embedding"]
         columns_expr = ",".join(columns)
@@ -1154,8 +1427,8 @@ class DocumentQuerySet:
             raise NotFound(f"Document with ID '{document_id}' not found.")
 
         data = dict(zip(columns, result))
-        data["metadata"] = json.loads(data["metadata"])
-        out = self.model.model_validate(data)
+        data["metadata"] = orjson.loads(data["metadata"])
+        out = self.model.model_construct(**data)
 
         if time_start is not None:
             time_end = time.perf_counter()
@@ -1260,7 +1533,7 @@ class DocumentQuerySet:
             for doc in documents
         ]
 
-        columns = list(documents[0].model_json_schema()["properties"].keys())
+        columns = list(model_columns(type(documents[0])))
         columns_expr = ", ".join(columns)
         placeholders = ", ".join(["?" for _ in columns])
         parameters: List[Tuple[Any, ...]] = [
@@ -1531,7 +1804,7 @@ class DocumentQuerySet:
 
         time_start = time.perf_counter() if debug else None
 
-        columns = list(self.model.model_json_schema()["properties"].keys())
+        columns = list(model_columns(self.model))
         columns_expr = ",".join(columns)
 
         query = f"SELECT {columns_expr} FROM {self.model.TABLE_NAME}\n"
@@ -1561,13 +1834,13 @@ class DocumentQuerySet:
                 + f"{DISPLAY_SQL_PARAMS.format(params=parameters)}\n"
             )
 
-        results_df: "pd.DataFrame" = (
-            conn.execute(query, parameters).fetch_arrow_table().to_pandas()
+        results: List[Dict] = (
+            conn.execute(query, parameters).fetch_arrow_table().to_pylist()
         )
-        results_df["metadata"] = results_df["metadata"].apply(json.loads)
-        results: List[Dict] = results_df.to_dict(orient="records")
+        for row in results:
+            row["metadata"] = orjson.loads(row["metadata"])
 
-        documents = [self.model.model_validate(row) for row in results[:limit]]
+        documents = [self.model.model_construct(**row) for row in results[:limit]]
 
         out = OpenaiPage(
             data=documents,
@@ -1708,8 +1981,7 @@ class DocumentQuerySet:
 
         time_start = time.perf_counter() if debug else None
 
-        query_template = jinja2.Template(sql_stmt_drop_table)
-        query = query_template.render(table_name=self.model.TABLE_NAME)
+        query = sql_tmpl_drop_table.render(table_name=self.model.TABLE_NAME)
         if debug:
             console.print(
                 f"\nDropping table: '{self.model.TABLE_NAME}' with SQL:\n"
@@ -1731,6 +2003,104 @@ class DocumentQuerySet:
             )
         return None
 
+    def documents_are_points_current(
+        self,
+        documents: Sequence["Document"],
+        *,
+        conn: "duckdb.DuckDBPyConnection",
+        max_workers: int = 4,
+        shard_size: int = 500,
+        debug: bool = False,
+    ) -> List[bool]:
+        """
+        Check whether the points of many documents are up-to-date.
+
+        The documents are split into shards of `shard_size`, each shard is checked
+        with one grouped aggregate query on its own `conn.cursor()`, and the shards
+        run concurrently in a thread pool as DuckDB releases the GIL while
+        executing queries.
+
+        Parameters
+        ----------
+        documents : Sequence[Document]
+            The documents to check.
+        conn : duckdb.DuckDBPyConnection
+            The DuckDB connection object to use for database operations.
+        max_workers : int, default 4
+            The maximum number of shards checked concurrently.
+        shard_size : int, default 500
+            The maximum number of documents checked in one query.
+        debug : bool, default False
+            If True, print debug information including SQL queries.
+
+        Returns
+        -------
+        List[bool]
+            For each document, in order, True if it has points and all of them
+            have the document's content_md5, False otherwise.
+
+        See Also
+        --------
+        Document.are_points_current : The single document check.
+        """  # noqa: E501
+
+        if not documents:
+            return []
+
+        time_start = time.perf_counter() if debug else None
+
+        def _render_shard(shard: Sequence["Document"]) -> Tuple[Text, List[Text]]:
+            query = sql_tmpl_documents_stale_points.render(
+                table_name=self.model.POINT_TYPE.TABLE_NAME,
+                placeholders=", ".join(["(?, ?)" for _ in shard]),
+            )
+            parameters: List[Text] = []
+            for _doc in shard:
+                parameters.extend([_doc.document_id, _doc.content_md5])
+            return (query, parameters)
+
+        def _check_shard(
+            cursor: "duckdb.DuckDBPyConnection", shard: Sequence["Document"]
+        ) -> Dict[Text, bool]:
+            query, parameters = _render_shard(shard)
+            try:
+                rows = cursor.execute(query, parameters).fetchall()
+            finally:
+                cursor.close()
+            return {doc_id: total > 0 and stale == 0 for doc_id, stale, total in rows}
+
+        shards = list(chunks(documents, shard_size))
+        if debug:
+            _query, _parameters = _render_shard(shards[0])
+            _display_params = display_sql_parameters(_parameters)
+            console.print(
+                f"\nChecking points of {len(documents)} documents "
+                + f"in {len(shards)} shards with SQL of the first shard:\n"
+                + f"{DISPLAY_SQL_QUERY.format(sql=_query)}\n"
+                + f"{DISPLAY_SQL_PARAMS.format(params=_display_params)}\n"
+            )
+
+        docs_current: Dict[Text, bool] = {}
+        if len(shards) == 1:
+            docs_current.update(_check_shard(conn.cursor(), shards[0]))
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(_check_shard, conn.cursor(), shard)
+                    for shard in shards
+                ]
+                for future in futures:
+                    docs_current.update(future.result())
+
+        if time_start is not None:
+            time_end = time.perf_counter()
+            time_elapsed = (time_end - time_start) * 1000
+            console.print(
+                f"Checked points of {len(documents)} documents in "
+                + f"{time_elapsed:.6f} ms"
+            )
+        return [docs_current.get(_doc.document_id, False) for _doc in documents]
+
     def documents_to_points(
         self,
         documents: Sequence["Document"],
@@ -1885,14 +2255,11 @@ class DocumentQuerySet:
             existing_outdated_points[idx] = []
 
         # Collect get point query
-        point_columns = list(
-            self.model.POINT_TYPE.model_json_schema()["properties"].keys()
-        )
+        point_columns = list(model_columns(self.model.POINT_TYPE))
         if not with_embeddings:
             point_columns = [c for c in point_columns if c != "embedding"]
         point_columns_expr = ",".join(point_columns)
-        query_by_doc_ids_template = jinja2.Template(sql_stmt_get_by_doc_ids)
-        query_by_doc_ids = query_by_doc_ids_template.render(
+        query_by_doc_ids = sql_tmpl_get_by_doc_ids.render(
             table_name=self.model.POINT_TYPE.TABLE_NAME,
             columns_expr=point_columns_expr,
             placeholders=", ".join(["?" for _ in documents]),
@@ -1910,10 +2277,9 @@ class DocumentQuerySet:
         for item in (
             conn.execute(query_by_doc_ids, params_by_doc_ids)
             .fetch_arrow_table()
-            .to_pandas()
-            .to_dict(orient="records")
+            .to_pylist()
         ):
-            _pt = self.model.POINT_TYPE.model_validate(item)
+            _pt = self.model.POINT_TYPE.model_construct(**item)
             _doc_idx = docs_ids_to_idx_map[_pt.document_id]
             if force is True:
                 existing_outdated_points[_doc_idx].append(_pt)
@@ -2154,6 +2520,84 @@ class DocumentQuerySet:
             console.print(f"Search execution time: {time_elapsed:.2f} ms")
         return out
 
+    def isearch_vector(
+        self,
+        vector: List[float],
+        *,
+        conn: "duckdb.DuckDBPyConnection",
+        top_k: int = 100,
+        with_embedding: bool = False,
+        rows_per_batch: int = 256,
+        debug: bool = False,
+    ) -> Generator["PointWithScore", None, None]:
+        """
+        Lazily yield the points most similar to a given embedding vector.
+
+        This is the streaming counterpart of `search_vector`. Results are read
+        from DuckDB in Arrow record batches of `rows_per_batch` rows, so peak
+        memory stays bounded for a large `top_k` and the caller may stop early.
+
+        Parameters
+        ----------
+        vector : List[float]
+            The query vector to search against. Should have the same dimensionality
+            as the stored point embeddings.
+        conn : duckdb.DuckDBPyConnection
+            The DuckDB connection object to use for database operations.
+        top_k : int, default 100
+            The number of top results to return.
+        with_embedding : bool, default False
+            If True, include the embedding vectors in the returned point results.
+        rows_per_batch : int, default 256
+            The number of rows fetched from DuckDB per record batch.
+        debug : bool, default False
+            If True, print debug information including SQL queries.
+
+        Yields
+        ------
+        PointWithScore
+            The matched points, sorted by descending similarity score.
+
+        See Also
+        --------
+        search_vector : Method that returns the points as a list, with documents.
+        """
+
+        from languru.documents.document import PointWithScore
+
+        point_type = self.model.POINT_TYPE
+        is_binary = point_type.EMBEDDING_QUANTIZATION == "binary"
+        query = render_vector_search_query(
+            table_name=point_type.TABLE_NAME,
+            columns_expr=vector_search_columns_expr(
+                point_type, with_embedding=with_embedding
+            ),
+            top_k=top_k,
+            rescore_top_k=(
+                top_k * point_type.EMBEDDING_RESCORE_FACTOR if is_binary else None
+            ),
+        )
+        parameters: List[Any] = (
+            [embedding_to_bits(vector), vector] if is_binary else [vector]
+        )
+
+        if debug:
+            _display_params = display_sql_parameters(parameters)
+            console.print(
+                "\nVector search with SQL:\n"
+                + f"{DISPLAY_SQL_QUERY.format(sql=query.strip())}\n"
+                + f"{DISPLAY_SQL_PARAMS.format(params=_display_params)}\n"
+            )
+
+        # Execute query and parse results batch by batch, DuckDB has already
+        # enforced the column types. The Python API has no reusable prepared
+        # statements and SQL `PREPARE` cannot bind the vector as a parameter, so
+        # only the rendered query string is cached.
+        reader = conn.execute(query, parameters).fetch_record_batch(rows_per_batch)
+        for batch in reader:
+            for row in batch.to_pylist():
+                yield PointWithScore.model_construct(**row)
+
     def search_vector(
         self,
         vector: List[float],
@@ -2209,61 +2653,45 @@ class DocumentQuerySet:
         search : Higher-level method that handles text queries and reranking.
         """
 
-        from languru.documents.document import PointWithScore
-
         time_start = time.perf_counter() if debug else None
 
-        # Get point columns
-        point_columns = list(
-            self.model.POINT_TYPE.model_json_schema()["properties"].keys()
-        )
-        if not with_embedding:
-            point_columns = [c for c in point_columns if c != "embedding"]
-        point_columns += [
-            "array_cosine_similarity("
-            + f"embedding, ?::FLOAT[{self.model.POINT_TYPE.EMBEDDING_DIMENSIONS}]"
-            + ") AS relevance_score"
-        ]
-
-        query_template = (
-            jinja2.Template(sql_stmt_vector_search_with_documents)
-            if with_documents
-            else jinja2.Template(sql_stmt_vector_search)
-        )
-        query = query_template.render(
-            table_name=self.model.POINT_TYPE.TABLE_NAME,
-            document_table_name=self.model.TABLE_NAME,
-            columns_expr=", ".join(point_columns),
-            top_k=top_k,
-        )
-        parameters = [vector]
-
-        if debug:
-            _display_params = display_sql_parameters(parameters)
-            console.print(
-                "\nVector search with SQL:\n"
-                + f"{DISPLAY_SQL_QUERY.format(sql=query.strip())}\n"
-                + f"{DISPLAY_SQL_PARAMS.format(params=_display_params)}\n"
+        points_with_score: List["PointWithScore"] = list(
+            self.isearch_vector(
+                vector,
+                conn=conn,
+                top_k=top_k,
+                with_embedding=with_embedding,
+                debug=debug,
             )
-
-        # Execute query
-        results_df: "pd.DataFrame" = (
-            conn.execute(query, parameters).fetch_arrow_table().to_pandas()
         )
-        results_df = results_df.loc[:, ~results_df.columns.duplicated()]
-
-        # Parse results
-        points_with_score = []
-        documents = []
-        walked_docs = set()
-        if with_documents:
-            results_df["metadata"] = results_df["metadata"].apply(json.loads)
-        rows: List[Dict] = results_df.to_dict(orient="records")
-        for row in rows:
-            points_with_score.append(PointWithScore.model_validate(row))
-            if with_documents and row["document_id"] not in walked_docs:
-                documents.append(self.model.model_validate(row))
-                walked_docs.add(row["document_id"])
+        documents: List["Document"] = []
+        if with_documents and points_with_score:
+            # Fetch each matched document once, in order of its best point
+            document_ids = list(dict.fromkeys(p.document_id for p in points_with_score))
+            doc_query = sql_tmpl_get_by_doc_ids.render(
+                table_name=self.model.TABLE_NAME,
+                columns_expr=",".join(model_columns(self.model)),
+                placeholders=", ".join(["?" for _ in document_ids]),
+            )
+            if debug:
+                _display_params = display_sql_parameters(document_ids)
+                console.print(
+                    "\nGetting matched documents with SQL:\n"
+                    + f"{DISPLAY_SQL_QUERY.format(sql=doc_query)}\n"
+                    + f"{DISPLAY_SQL_PARAMS.format(params=_display_params)}\n"
+                )
+            docs_map: Dict[Text, "Document"] = {}
+            doc_rows: List[Dict] = (
+                conn.execute(doc_query, document_ids).fetch_arrow_table().to_pylist()
+            )
+            for row in doc_rows:
+                row["metadata"] = orjson.loads(row["metadata"])
+                docs_map[row["document_id"]] = self.model.model_construct(**row)
+            documents = [docs_map[d] for d in document_ids if d in docs_map]
+            # Keep only points that belong to an existing document
+            points_with_score = [
+                p for p in points_with_score if p.document_id in docs_map
+            ]
 
         # Log execution time
         if time_start is not None:
@@ -1,6 +1,10 @@
+import asyncio
+import atexit
+import functools
 import hashlib
 import os
 import time
+from dataclasses import dataclass
 from itertools import zip_longest
 from types import MappingProxyType
 from typing import (
@@ -8,9 +12,11 @@ from typing import (
     Any,
     ClassVar,
     Dict,
+    Iterator,
     List,
     Literal,
     Optional,
+    Sequence,
     Text,
     Tuple,
     Type,
@@ -18,11 +24,13 @@ from typing import (
     overload,
 )
 
+import numpy as np
+import pyarrow as pa
 from cyksuid.v2 import ksuid
 from diskcache import Cache
 from openai import OpenAI
 from pathvalidate import sanitize_filepath
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 from languru.documents._client import (
     DocumentQuerySet,
@@ -30,12 +38,24 @@ from languru.documents._client import (
     PointQuerySet,
     PointQuerySetDescriptor,
 )
-from languru.utils.openai_utils import embeddings_create_with_cache
+from languru.utils.openai_utils import (
+    embeddings_array_create_with_cache,
+    embeddings_create_with_cache,
+)
 
 if TYPE_CHECKING:
     import duckdb
 
 
+@functools.lru_cache(maxsize=None)
+def open_embedding_cache(directory: Text, size_limit: int) -> Cache:
+    """Open the embedding cache once per directory, closing it at exit."""
+
+    cache = Cache(directory=directory, size_limit=size_limit)
+    atexit.register(cache.close)
+    return cache
+
+
 class Point(BaseModel):
     model_config = ConfigDict(str_strip_whitespace=True)
     TABLE_NAME: ClassVar[Text] = "points"
@@ -45,6 +65,9 @@ class Point(BaseModel):
         os.path.expanduser("~"), ".languru"
     )
     EMBEDDING_CACHE_LIMIT: ClassVar[int] = 2**30  # 1GB
+    # Set to "binary" to search by sign bits first, then rescore by cosine
+    EMBEDDING_QUANTIZATION: ClassVar[Optional[Literal["binary"]]] = None
+    EMBEDDING_RESCORE_FACTOR: ClassVar[int] = 4
     objects: ClassVar["PointQuerySetDescriptor"] = PointQuerySetDescriptor()
 
     point_id: Text = Field(
@@ -72,7 +95,14 @@ class Point(BaseModel):
     @classmethod
     def embedding_cache(cls, model: Text) -> Cache:
         cache_path = sanitize_filepath(os.path.join(cls.EMBEDDING_CACHE_PATH, model))
-        return Cache(directory=cache_path, size_limit=cls.EMBEDDING_CACHE_LIMIT)
+        return open_embedding_cache(cache_path, cls.EMBEDDING_CACHE_LIMIT)
+
+    @classmethod
+    def bulk_new_ids(cls, n: int) -> List[Text]:
+        """Generate `n` new point IDs, time-sortable like the default factory."""
+
+        prefix = "pt_"
+        return [prefix + str(ksuid()) for _ in range(n)]
 
     def is_embedded(self) -> bool:
         return False if len(self.embedding) == 0 else True
@@ -84,10 +114,107 @@ class PointWithScore(Point):
     relevance_score: float = Field(description="The score of the point.")
 
 
+@dataclass
+class PointBatch:
+    """
+    A batch of points stored column-wise, with all embeddings in one matrix.
+
+    The embeddings are kept as a contiguous float32 array of shape (N, D)
+    instead of N boxed Python lists, and are handed to DuckDB as an Arrow
+    fixed size list column. `Point` objects are only built when indexed.
+
+    Attributes
+    ----------
+    point_ids : np.ndarray
+        The point IDs, an object array of shape (N,).
+    document_ids : np.ndarray
+        The document ID of each point, an object array of shape (N,).
+    content_md5s : np.ndarray
+        The content hash of each point, an object array of shape (N,).
+    embeddings : np.ndarray
+        The embeddings, a float32 array of shape (N, D).
+    point_type : Type[Point], default Point
+        The Point model the rows belong to.
+    """
+
+    point_ids: np.ndarray
+    document_ids: np.ndarray
+    content_md5s: np.ndarray
+    embeddings: np.ndarray
+    point_type: Type[Point] = Point
+
+    def __post_init__(self):
+        self.embeddings = np.ascontiguousarray(self.embeddings, dtype=np.float32)
+        if self.embeddings.ndim != 2:
+            raise ValueError("The embeddings must be a 2-D array of shape (N, D).")
+        size = self.embeddings.shape[0]
+        for name in ("point_ids", "document_ids", "content_md5s"):
+            if len(getattr(self, name)) != size:
+                raise ValueError(f"The length of '{name}' must match the embeddings.")
+
+    def __len__(self) -> int:
+        return self.embeddings.shape[0]
+
+    def __getitem__(self, idx: int) -> Point:
+        return self.point_type.model_construct(
+            point_id=self.point_ids[idx],
+            document_id=self.document_ids[idx],
+            content_md5=self.content_md5s[idx],
+            embedding=self.embeddings[idx].tolist(),
+        )
+
+    def __iter__(self) -> Iterator[Point]:
+        for idx in range(len(self)):
+            yield self[idx]
+
+    @classmethod
+    def from_points(
+        cls, points: Sequence[Point], *, point_type: Optional[Type[Point]] = None
+    ) -> "PointBatch":
+        """Build a batch from embedded points, raising ValueError otherwise."""
+
+        for idx, pt in enumerate(points):
+            if pt.is_embedded() is False:
+                raise ValueError(
+                    f"Points[{idx}] is not embedded, please embed it first."
+                )
+        point_type = point_type or (type(points[0]) if points else Point)
+        return cls(
+            point_ids=np.array([pt.point_id for pt in points], dtype=object),
+            document_ids=np.array([pt.document_id for pt in points], dtype=object),
+            content_md5s=np.array([pt.content_md5 for pt in points], dtype=object),
+            embeddings=(
+                np.array([pt.embedding for pt in points], dtype=np.float32)
+                if points
+                else np.empty((0, point_type.EMBEDDING_DIMENSIONS), np.float32)
+            ),
+            point_type=point_type,
+        )
+
+    def to_points(self) -> List[Point]:
+        return list(self)
+
+    def to_arrow(self) -> pa.Table:
+        """Return the batch as an Arrow table with a fixed size list embedding."""
+
+        dimensions = self.embeddings.shape[1]
+        return pa.table(
+            {
+                "point_id": pa.array(self.point_ids, type=pa.string()),
+                "document_id": pa.array(self.document_ids, type=pa.string()),
+                "content_md5": pa.array(self.content_md5s, type=pa.string()),
+                "embedding": pa.FixedSizeListArray.from_arrays(
+                    pa.array(self.embeddings.ravel(), type=pa.float32()), dimensions
+                ),
+            }
+        )
+
+
 class Document(BaseModel):
     model_config = ConfigDict(str_strip_whitespace=True)
     TABLE_NAME: ClassVar[Text] = "documents"
     POINT_TYPE: ClassVar[Type[Point]] = Point
+    HASH_CONTENT_THREAD_THRESHOLD: ClassVar[int] = 2**16  # 64KB
     objects: ClassVar["DocumentQuerySetDescriptor"] = DocumentQuerySetDescriptor()
 
     document_id: Text = Field(
@@ -109,6 +236,18 @@ class Document(BaseModel):
         description="The timestamp of when the document was last updated.",
     )
 
+    @model_validator(mode="before")
+    @classmethod
+    def set_default_timestamps(cls, data: Any) -> Any:
+        """Default created_at and updated_at to one shared timestamp."""
+
+        if isinstance(data, dict) and (
+            "created_at" not in data or "updated_at" not in data
+        ):
+            now = int(time.time())
+            data = {"created_at": now, "updated_at": now, **data}
+        return data
+
     @classmethod
     def query_set(cls) -> "DocumentQuerySet":
         from languru.documents._client import DocumentQuerySet
@@ -128,10 +267,52 @@ class Document(BaseModel):
             }
         )
 
+    @classmethod
+    async def afrom_content(
+        cls, name: Text, content: Text, *, metadata: Optional[Dict[Text, Any]] = None
+    ) -> "Document":
+        return cls.model_validate(
+            {
+                "content": content,
+                "content_md5": await cls.ahash_content(content),
+                "name": name,
+                "metadata": metadata or {},
+            }
+        )
+
     @classmethod
     def hash_content(cls, content: Text) -> Text:
+        """Hash the stripped content into a 32 characters hex digest.
+
+        BLAKE2b with a 16 bytes digest is used instead of MD5, it is faster on
+        64-bit platforms and keeps the same length as `content_md5` column.
+        Digests written with MD5 stay valid, `strip` keeps a stored digest
+        matching `legacy_hash_content` so legacy rows keep matching their
+        points until the content changes.
+        """
+
+        return hashlib.blake2b(
+            content.strip().encode("utf-8"), digest_size=16
+        ).hexdigest()
+
+    @classmethod
+    def legacy_hash_content(cls, content: Text) -> Text:
+        """Hash the stripped content with MD5, the digest of the legacy rows."""
+
         return hashlib.md5(content.strip().encode("utf-8")).hexdigest()
 
+    @classmethod
+    async def ahash_content(cls, content: Text) -> Text:
+        """Hash the content like `hash_content` without blocking the event loop.
+
+        Content of at least `HASH_CONTENT_THREAD_THRESHOLD` characters is hashed
+        in a worker thread, smaller content is cheaper to hash inline.
+        """
+
+        if len(content) < cls.HASH_CONTENT_THREAD_THRESHOLD:
+            return cls.hash_content(content)
+        return await asyncio.to_thread(cls.hash_content, content)
+
     @overload
     def to_points(
         self,
@@ -235,10 +416,11 @@ class Document(BaseModel):
                 )
 
         # Create points
-        for embedding, doc_card in zip_longest(
-            embeddings or [], doc_cards, fillvalue=None
+        point_ids = self.POINT_TYPE.bulk_new_ids(len(doc_cards))
+        for point_id, embedding, doc_card in zip_longest(
+            point_ids, embeddings or [], doc_cards, fillvalue=None
         ):
-            pt_params: Dict = dict(base_params)
+            pt_params: Dict = dict(base_params, point_id=point_id)
             if embedding is not None:
                 pt_params["embedding"] = embedding
             if with_document_card:
@@ -248,6 +430,76 @@ class Document(BaseModel):
 
         return out
 
+    @classmethod
+    def to_points_batch(
+        cls,
+        documents: Sequence["Document"],
+        *,
+        openai_client: "OpenAI",
+        batch_size: int = 500,
+        debug: bool = False,
+    ) -> "PointBatch":
+        """
+        Convert multiple documents into a PointBatch with batched embeddings.
+
+        Unlike calling `to_points` on each document, the document cards of all
+        documents are embedded together, so K documents cost one embeddings
+        request per `batch_size` uncached cards instead of K requests.
+
+        Parameters
+        ----------
+        documents : Sequence[Document]
+            The documents to convert into points.
+        openai_client : OpenAI
+            An instance of the OpenAI client to use for generating embeddings.
+        batch_size : int, default 500
+            The maximum number of document cards sent in one embeddings request.
+        debug : bool, default False
+            If True, enables debug mode for additional logging or verbose output.
+
+        Returns
+        -------
+        PointBatch
+            The points of all documents, grouped in the order of `documents`.
+            Use `PointQuerySet.bulk_create_batch` to insert them.
+
+        See Also
+        --------
+        DocumentQuerySet.documents_to_points : The batched conversion into points.
+        """  # noqa: E501
+
+        point_type = cls.POINT_TYPE
+        document_ids: List[Text] = []
+        content_md5s: List[Text] = []
+        doc_cards: List[Text] = []
+        for _doc in documents:
+            _doc.strip()
+            _doc_cards = _doc.to_document_cards()
+            document_ids.extend([_doc.document_id] * len(_doc_cards))
+            content_md5s.extend([_doc.content_md5] * len(_doc_cards))
+            doc_cards.extend(_doc_cards)
+
+        # Embed straight into the batch matrix, without building points
+        embeddings = np.empty(
+            (len(doc_cards), point_type.EMBEDDING_DIMENSIONS), dtype=np.float32
+        )
+        for start in range(0, len(doc_cards), batch_size):
+            embeddings[start : start + batch_size] = embeddings_array_create_with_cache(
+                input=doc_cards[start : start + batch_size],
+                model=point_type.EMBEDDING_MODEL,
+                dimensions=point_type.EMBEDDING_DIMENSIONS,
+                openai_client=openai_client,
+                cache=point_type.embedding_cache(point_type.EMBEDDING_MODEL),
+            )
+
+        return PointBatch(
+            point_ids=np.array(point_type.bulk_new_ids(len(doc_cards)), dtype=object),
+            document_ids=np.array(document_ids, dtype=object),
+            content_md5s=np.array(content_md5s, dtype=object),
+            embeddings=embeddings,
+            point_type=point_type,
+        )
+
     def has_points(
         self, *, conn: "duckdb.DuckDBPyConnection", debug: bool = False
     ) -> bool:
@@ -312,10 +564,9 @@ class Document(BaseModel):
 
         Notes
         -----
-        - The method uses pagination to handle potentially large numbers of points.
-        - It returns False immediately if no points are found for the document.
-        - The check is performed by comparing the content_md5 of each point with
-        the current document's content_md5.
+        - It returns False if no points are found for the document.
+        - The check is a single aggregate query comparing the content_md5 of each
+        point with the current document's content_md5.
 
         See Also
         --------
@@ -323,27 +574,10 @@ class Document(BaseModel):
         PointQuerySet : The query set used for database operations on Point objects.
         """
 
-        after = None
-        has_more = True
-        while has_more:
-            page_points = Point.objects.list(
-                document_id=self.document_id, after=after, conn=conn, debug=debug
-            )
-
-            # Return False if no points are found
-            if len(page_points.data) == 0 and after is None:
-                return False
-
-            # Return False if any point is out of date
-            for pt in page_points.data:
-                if pt.content_md5 != self.content_md5:
-                    return False
-
-            # Update pagination state
-            after = page_points.last_id
-            has_more = page_points.has_more
-
-        return True
+        any_stale = self.POINT_TYPE.objects.any_stale(
+            self.document_id, self.content_md5, conn=conn, debug=debug
+        )
+        return any_stale is False
 
     def sync_points(
         self,
@@ -477,11 +711,13 @@ class Document(BaseModel):
 
         This method removes leading and trailing whitespace from the document's content.
         If the content changes, it updates the content_md5 and the updated_at timestamp.
+        A legacy MD5 content_md5 still matching the content is kept.
 
         Parameters
         ----------
         copy : bool, default False
-            If True, creates a deep copy of the document before modifying it.
+            If True, creates a shallow copy of the document before modifying it,
+            the copy shares the `metadata` dict with the original.
             If False, modifies the document in-place.
 
         Returns
@@ -500,10 +736,12 @@ class Document(BaseModel):
         Document.hash_content : Class method used to generate the MD5 hash of the content.
         """  # noqa: E501
 
-        _doc = self.model_copy(deep=True) if copy else self
+        _doc = self.model_copy() if copy else self
         _doc.content = _doc.content.strip()
         new_md5 = self.hash_content(_doc.content)
-        if _doc.content_md5 != new_md5:
+        if _doc.content_md5 != new_md5 and (
+            _doc.content_md5 != self.legacy_hash_content(_doc.content)
+        ):
             _doc.content_md5 = new_md5
             _doc.updated_at = int(time.time())
         return _doc
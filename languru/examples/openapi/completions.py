@@ -0,0 +1,15 @@
+completion_openai_basic = {
+    "summary": "Quick text completion",
+    "description": "Text completion request",
+    "value": {
+        "model": "gpt-3.5-turbo-instruct",
+        "prompt": "Say this is a test",
+        "max_tokens": 7,
+        "temperature": 0,
+    },
+}
+
+
+completion_openapi_examples = {
+    "Quick text completion": completion_openai_basic,
+}
@@ -0,0 +1,13 @@
+embedding_openai_basic = {
+    "summary": "Quick embedding",
+    "description": "Embedding request",
+    "value": {
+        "model": "text-embedding-ada-002",
+        "input": "The food was delicious and the waiter...",
+    },
+}
+
+
+embedding_openapi_examples = {
+    "Quick embedding": embedding_openai_basic,
+}
@@ -0,0 +1,10 @@
+moderation_openai_basic = {
+    "summary": "A quick example of a moderation request",
+    "description": "A quick example of a moderation request",
+    "value": {"input": "I want to kill them."},
+}
+
+
+moderation_openapi_examples = {
+    "Quick example": moderation_openai_basic,
+}
@@ -2,6 +2,7 @@ import json
 from textwrap import dedent
 from typing import Any, Callable, ClassVar, Final, Text
 
+import orjson
 from json_repair import repair_json
 from openai.types.beta.function_tool import FunctionTool
 from openai.types.beta.threads import run_submit_tool_outputs_params
@@ -72,7 +73,11 @@ class FunctionToolRequestBaseModel(BaseModel):
 
     @classmethod
     def from_args_str(cls, args_str: Text):
-        func_kwargs = (
-            json.loads(repair_json(args_str)) if args_str else {}  # type: ignore
-        )
+        if not args_str:
+            return cls.model_validate({})
+        # Tool call arguments are valid JSON most of the time, repair otherwise
+        try:
+            func_kwargs = orjson.loads(args_str)
+        except orjson.JSONDecodeError:
+            func_kwargs = json.loads(repair_json(args_str))  # type: ignore
         return cls.model_validate(func_kwargs)
@@ -1,12 +1,14 @@
-from typing import Dict, List, Text, Type, TypeVar
+import asyncio
+from typing import Dict, List, Optional, Sequence, Text, Type, TypeVar
 
 import pyjson5
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
+from openai.types.chat import ChatCompletionMessageParam
 from pyassorted.string import extract_code_blocks
 from pydantic import BaseModel
 from pydantic_core import ValidationError
 
-from languru.config import logger
+from languru.config import logger, settings
 from languru.prompts import PromptTemplate
 from languru.prompts.repositories.data_model import prompt_date_model_from_openai
 from languru.utils.common import display_messages, ensure_list
@@ -26,24 +28,37 @@ class DataModel(BaseModel):
         verbose: bool = False,
         **kwargs,
     ) -> List[DataModelTypeVar]:
-        # Get schema
-        schema = cls.model_json_schema()
-        model_schema = {cls.__name__: schema}
+        input_messages = cls._model_from_openai_messages(content)
+        if verbose:
+            display_messages(
+                messages=input_messages,
+                table_title=f"{client.__class__.__name__} Chat Messages Input",
+            )
 
-        # Prepare prompt
-        user_message = {
-            "role": "user",
-            "content": (
-                "<model_json_schema>\n{model_schema}\n</model_json_schema>\n\n"
-                + "{user_says}"
-            ),
-        }
-        prompt_template = PromptTemplate(
-            prompt_date_model_from_openai, messages=[user_message]
-        )
-        input_messages = prompt_template.format_messages(
-            prompt_vars={"model_schema": model_schema, "user_says": content}
+        # Generate response
+        chat_res = client.chat.completions.create(
+            messages=input_messages, model=model, temperature=0.0
         )
+        chat_answer = ensure_openai_chat_completion_content(chat_res)
+        if verbose:
+            display_messages(
+                messages=[{"role": "assistant", "content": chat_answer}],
+                table_title=f"{client.__class__.__name__}({model}) Chat Response",
+            )
+
+        return cls._models_from_openai_answer(chat_answer)
+
+    @classmethod
+    async def amodel_from_openai(
+        cls: Type[DataModelTypeVar],
+        content: Text,
+        client: "AsyncOpenAI",
+        model: Text = "gpt-4o-mini",
+        *,
+        verbose: bool = False,
+        **kwargs,
+    ) -> List[DataModelTypeVar]:
+        input_messages = cls._model_from_openai_messages(content)
         if verbose:
             display_messages(
                 messages=input_messages,
@@ -51,7 +66,7 @@ class DataModel(BaseModel):
             )
 
         # Generate response
-        chat_res = client.chat.completions.create(
+        chat_res = await client.chat.completions.create(
             messages=input_messages, model=model, temperature=0.0
         )
         chat_answer = ensure_openai_chat_completion_content(chat_res)
@@ -61,6 +76,86 @@ class DataModel(BaseModel):
                 table_title=f"{client.__class__.__name__}({model}) Chat Response",
             )
 
+        return cls._models_from_openai_answer(chat_answer)
+
+    @classmethod
+    async def abatch_model_from_openai(
+        cls: Type[DataModelTypeVar],
+        contents: Sequence[Text],
+        client: "AsyncOpenAI",
+        model: Text = "gpt-4o-mini",
+        *,
+        concurrency: Optional[int] = None,
+        verbose: bool = False,
+        **kwargs,
+    ) -> List[List[DataModelTypeVar]]:
+        """Generate models from multiple contents with concurrent requests.
+
+        The number of in-flight requests is bounded by `concurrency`, which
+        defaults to `settings.openai_num_parallel` (env `OPENAI_NUM_PARALLEL`).
+        """
+
+        semaphore = asyncio.Semaphore(concurrency or settings.openai_num_parallel)
+
+        async def _bounded(content: Text) -> List[DataModelTypeVar]:
+            async with semaphore:
+                return await cls.amodel_from_openai(
+                    content, client, model, verbose=verbose, **kwargs
+                )
+
+        return list(await asyncio.gather(*(_bounded(c) for c in contents)))
+
+    @classmethod
+    def batch_model_from_openai(
+        cls: Type[DataModelTypeVar],
+        contents: Sequence[Text],
+        client: "AsyncOpenAI",
+        model: Text = "gpt-4o-mini",
+        *,
+        concurrency: Optional[int] = None,
+        verbose: bool = False,
+        **kwargs,
+    ) -> List[List[DataModelTypeVar]]:
+        """Synchronous wrapper of `abatch_model_from_openai`."""
+
+        return asyncio.run(
+            cls.abatch_model_from_openai(
+                contents,
+                client,
+                model,
+                concurrency=concurrency,
+                verbose=verbose,
+                **kwargs,
+            )
+        )
+
+    @classmethod
+    def _model_from_openai_messages(
+        cls, content: Text
+    ) -> List[ChatCompletionMessageParam]:
+        # Get schema
+        schema = cls.model_json_schema()
+        model_schema = {cls.__name__: schema}
+
+        # Prepare prompt
+        user_message = {
+            "role": "user",
+            "content": (
+                "<model_json_schema>\n{model_schema}\n</model_json_schema>\n\n"
+                + "{user_says}"
+            ),
+        }
+        prompt_template = PromptTemplate(
+            prompt_date_model_from_openai, messages=[user_message]
+        )
+        return prompt_template.format_messages(
+            prompt_vars={"model_schema": model_schema, "user_says": content}
+        )
+
+    @classmethod
+    def _models_from_openai_answer(
+        cls: Type[DataModelTypeVar], chat_answer: Text
+    ) -> List[DataModelTypeVar]:
         # Parse response
         code_blocks = extract_code_blocks(chat_answer, language="json")
         if len(code_blocks) == 0:
@@ -1,11 +1,12 @@
 from languru.openai_plugins.clients.anthropic import AnthropicOpenAI
-from languru.openai_plugins.clients.google import GoogleOpenAI
+from languru.openai_plugins.clients.google import AsyncGoogleOpenAI, GoogleOpenAI
 from languru.openai_plugins.clients.groq import GroqOpenAI
 from languru.openai_plugins.clients.pplx import PerplexityOpenAI
 from languru.openai_plugins.clients.voyage import VoyageOpenAI
 
 __all__ = [
     "AnthropicOpenAI",
+    "AsyncGoogleOpenAI",
     "GoogleOpenAI",
     "GroqOpenAI",
     "PerplexityOpenAI",
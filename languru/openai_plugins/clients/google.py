@@ -1,7 +1,17 @@
 import os
 import time
 import uuid
-from typing import Dict, Generator, Iterable, List, Literal, Optional, Text, Union
+from typing import (
+    AsyncGenerator,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Text,
+    Union,
+)
 
 import google.generativeai as genai
 import httpx
@@ -9,15 +19,15 @@ import openai
 from google.api_core.exceptions import NotFound as GoogleNotFound
 from google.generativeai.types import generation_types
 from google.generativeai.types.content_types import ContentDict
-from httpx._transports.default import ResponseStream
-from openai import OpenAI
+from httpx._transports.default import AsyncResponseStream, ResponseStream
+from openai import AsyncOpenAI, OpenAI
 from openai import resources as OpenAIResources
 from openai._compat import cached_property
-from openai._streaming import Stream
+from openai._streaming import AsyncStream, Stream
 from openai._types import NOT_GIVEN, Body, Headers, NotGiven, Query
 from openai._utils import required_args
 from openai.pagination import SyncPage
-from openai.resources.chat.completions import Completions
+from openai.resources.chat.completions import AsyncCompletions, Completions
 from openai.types.chat import completion_create_params
 from openai.types.chat.chat_completion import ChatCompletion
 from openai.types.chat.chat_completion_chunk import ChatCompletionChunk
@@ -174,53 +184,21 @@ class GoogleChatCompletions(Completions):
 
         # pop out the last message
         genai_model = genai.GenerativeModel(model)
-        contents: List[ContentDict] = [
-            ContentDict(
-                role=(
-                    "model" if m["role"] == "assistant" else "user"
-                ),  # Gemini roles: user, model
-                parts=[m["content"]],
-            )
-            for m in messages
-            if "content" in m and m["content"]
-        ]
+        contents = messages_to_genai_contents(messages)
         input_tokens = genai_model.count_tokens(contents).total_tokens
 
         # Generate the chat response
         latest_content = contents.pop()
         chat_session = genai_model.start_chat(history=contents or None)
-        send_message_kwargs = dict()
-        if temperature is not None and not isinstance(temperature, NotGiven):
-            send_message_kwargs["generation_config"] = (
-                generation_types.GenerationConfigDict(temperature=temperature)
-            )
-        response = chat_session.send_message(latest_content, **send_message_kwargs)
+        response = chat_session.send_message(
+            latest_content, **genai_send_message_kwargs(temperature=temperature)
+        )
         out_tokens = genai_model.count_tokens(response.parts).total_tokens
 
         # Parse the response
-        chat_completion = ChatCompletion.model_validate(
-            dict(
-                id=str(uuid.uuid4()),
-                choices=[
-                    dict(
-                        finish_reason="stop",
-                        index=idx,
-                        message=dict(content=part.text, role="assistant"),
-                    )
-                    for idx, part in enumerate(response.parts)
-                    if part.text
-                ],
-                created=int(time.time()),
-                model=model,
-                object="chat.completion",
-                usage=dict(
-                    completion_tokens=out_tokens,
-                    prompt_tokens=input_tokens,
-                    total_tokens=input_tokens + out_tokens,
-                ),
-            )
+        return genai_response_to_chat_completion(
+            response, model=model, input_tokens=input_tokens, out_tokens=out_tokens
         )
-        return chat_completion
 
     def _create_stream(
         self,
@@ -267,28 +245,15 @@ class GoogleChatCompletions(Completions):
 
         # pop out the last message
         genai_model = genai.GenerativeModel(model)
-        contents: List[ContentDict] = [
-            ContentDict(
-                role=(
-                    "model" if m["role"] == "assistant" else "user"
-                ),  # Gemini roles: user, model
-                parts=[m["content"]],
-            )
-            for m in messages
-            if "content" in m and m["content"]
-        ]
+        contents = messages_to_genai_contents(messages)
 
         # Generate the chat response
         latest_content = contents.pop()
         chat_session = genai_model.start_chat(history=contents or None)
-        send_message_kwargs = dict()
-        if temperature is not None and not isinstance(temperature, NotGiven):
-            send_message_kwargs["generation_config"] = (
-                generation_types.GenerationConfigDict(temperature=temperature)
-            )
-        send_message_kwargs["stream"] = True
         genai_response = chat_session.send_message(
-            latest_content, **send_message_kwargs
+            latest_content,
+            stream=True,
+            **genai_send_message_kwargs(temperature=temperature),
         )
         httpx_response_stream = ResponseStream(
             self.generator_generate_content_chunks(genai_response, model=model)
@@ -337,34 +302,17 @@ class GoogleChatCompletions(Completions):
 
         # Generate the chat response
         for generate_content_chunk in generate_content_response:
-            parts_content = "\n".join(
-                p.text for p in generate_content_chunk.candidates[0].content.parts
-            )
-            chunk = ChatCompletionChunk.model_validate(
-                {
-                    "id": chat_completion_id,
-                    "choices": [
-                        {
-                            "index": 0,
-                            "delta": {"content": parts_content, "role": "assistant"},
-                        }
-                    ],
-                    "created": created,
-                    "model": model,
-                    "object": "chat.completion.chunk",
-                }
+            chunk = genai_chunk_to_chat_completion_chunk(
+                generate_content_chunk,
+                model=model,
+                created=created,
+                chat_completion_id=chat_completion_id,
             )
             yield simple_encode_sse(chunk, encoding=encoding)
 
         # Send the final chunk with finish_reason
-        chunk = ChatCompletionChunk.model_validate(
-            {
-                "id": chat_completion_id,
-                "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}],
-                "created": created,
-                "model": model,
-                "object": "chat.completion.chunk",
-            }
+        chunk = genai_chunk_to_chat_completion_chunk(
+            None, model=model, created=created, chat_completion_id=chat_completion_id
         )
         yield simple_encode_sse(chunk, encoding=encoding)
 
@@ -495,3 +443,247 @@ class GoogleOpenAI(OpenAI):
         self.chat = GoogleChat(self)
         self.models = GoogleModels(self)
         self.embeddings = GoogleEmbeddings(self)
+
+
+class AsyncGoogleChatCompletions(AsyncCompletions):
+    @required_args(["messages", "model"], ["messages", "model", "stream"])
+    async def create(  # type: ignore[override]
+        self,
+        *,
+        messages: Iterable[ChatCompletionMessageParam],
+        model: Union[str, ChatModel],
+        stream: Optional[Literal[False]] | Literal[True] | NotGiven = NOT_GIVEN,
+        temperature: Optional[float] | NotGiven = NOT_GIVEN,
+        **kwargs,
+    ) -> ChatCompletion | AsyncStream[ChatCompletionChunk]:
+        if stream is True:
+            return await self._create_stream(
+                messages=messages, model=model, temperature=temperature
+            )
+        return await self._create(
+            messages=messages, model=model, temperature=temperature
+        )
+
+    async def _create(
+        self,
+        *,
+        messages: Iterable[ChatCompletionMessageParam],
+        model: Union[str, ChatModel],
+        temperature: Optional[float] | NotGiven = NOT_GIVEN,
+    ) -> ChatCompletion:
+        """Create a chat completion with the Google GenAI async API."""
+
+        messages = list(messages)
+        if len(messages) == 0:
+            raise ValueError("The `messages` must not be empty")
+
+        genai_model = genai.GenerativeModel(model)
+        contents = messages_to_genai_contents(messages)
+        input_tokens = (await genai_model.count_tokens_async(contents)).total_tokens
+
+        # Generate the chat response
+        latest_content = contents.pop()
+        chat_session = genai_model.start_chat(history=contents or None)
+        response = await chat_session.send_message_async(
+            latest_content, **genai_send_message_kwargs(temperature=temperature)
+        )
+        out_tokens = (await genai_model.count_tokens_async(response.parts)).total_tokens
+
+        # Parse the response
+        return genai_response_to_chat_completion(
+            response, model=model, input_tokens=input_tokens, out_tokens=out_tokens
+        )
+
+    async def _create_stream(
+        self,
+        *,
+        messages: Iterable[ChatCompletionMessageParam],
+        model: Union[str, ChatModel],
+        temperature: Optional[float] | NotGiven = NOT_GIVEN,
+    ) -> AsyncStream[ChatCompletionChunk]:
+        """Create a chat completion stream with the Google GenAI async API."""
+
+        messages = list(messages)
+        if len(messages) == 0:
+            raise ValueError("The `messages` must not be empty")
+
+        genai_model = genai.GenerativeModel(model)
+        contents = messages_to_genai_contents(messages)
+
+        # Generate the chat response
+        latest_content = contents.pop()
+        chat_session = genai_model.start_chat(history=contents or None)
+        genai_response = await chat_session.send_message_async(
+            latest_content,
+            stream=True,
+            **genai_send_message_kwargs(temperature=temperature),
+        )
+        httpx_response = httpx.Response(
+            status_code=200,
+            headers={"content-type": "text/plain"},
+            stream=AsyncResponseStream(
+                self.agenerator_generate_content_chunks(genai_response, model=model)
+            ),
+        )
+        return AsyncStream(
+            cast_to=ChatCompletionChunk, response=httpx_response, client=self._client
+        )
+
+    async def agenerator_generate_content_chunks(
+        self,
+        generate_content_response: "generation_types.AsyncGenerateContentResponse",
+        *,
+        model: Text,
+        encoding: Text = "utf-8",
+        created: Optional[int] = None,
+        chat_completion_id: Optional[Text] = None,
+    ) -> AsyncGenerator[bytes, None]:
+        """Asynchronously generate the chat completion response in chunks.
+
+        See `GoogleChatCompletions.generator_generate_content_chunks`.
+        """
+
+        chat_completion_id = chat_completion_id or rand_chat_completion_id()
+        created = created or int(time.time())
+
+        # Generate the chat response
+        async for generate_content_chunk in generate_content_response:
+            chunk = genai_chunk_to_chat_completion_chunk(
+                generate_content_chunk,
+                model=model,
+                created=created,
+                chat_completion_id=chat_completion_id,
+            )
+            yield simple_encode_sse(chunk, encoding=encoding)
+
+        # Send the final chunk with finish_reason
+        chunk = genai_chunk_to_chat_completion_chunk(
+            None, model=model, created=created, chat_completion_id=chat_completion_id
+        )
+        yield simple_encode_sse(chunk, encoding=encoding)
+
+        # End the stream
+        yield simple_encode_sse("[DONE]", encoding=encoding)
+
+
+class AsyncGoogleChat(OpenAIResources.AsyncChat):
+    @cached_property
+    def completions(self) -> AsyncGoogleChatCompletions:
+        return AsyncGoogleChatCompletions(self._client)
+
+
+class AsyncGoogleOpenAI(AsyncOpenAI):
+    """Async Google GenAI client, only `chat.completions` is supported now."""
+
+    chat: AsyncGoogleChat
+
+    def __init__(self, *, api_key: Optional[Text] = None, **kwargs):
+        api_key = (
+            api_key
+            or os.getenv("GOOGLE_GENAI_API_KEY")
+            or os.getenv("GOOGLE_AI_API_KEY")
+            or os.getenv("GOOGLE_API_KEY")
+            or os.getenv("OPENAI_API_KEY")
+        )
+        if not api_key:
+            raise CredentialsNotProvided("Google GenAI API key is not provided")
+        kwargs["api_key"] = api_key
+        kwargs = {k: v for k, v in kwargs.items() if k in openai_init_parameter_keys}
+
+        super().__init__(**kwargs)
+
+        genai.configure(api_key=api_key)
+
+        self.chat = AsyncGoogleChat(self)
+
+
+def messages_to_genai_contents(
+    messages: Iterable[ChatCompletionMessageParam],
+) -> List[ContentDict]:
+    """Convert OpenAI chat messages to Gemini contents (roles: user, model)."""
+
+    return [
+        ContentDict(
+            role="model" if m["role"] == "assistant" else "user",
+            parts=[m["content"]],
+        )
+        for m in messages
+        if "content" in m and m["content"]
+    ]
+
+
+def genai_send_message_kwargs(
+    *, temperature: Optional[float] | NotGiven = NOT_GIVEN
+) -> Dict:
+    send_message_kwargs = dict()
+    if temperature is not None and not isinstance(temperature, NotGiven):
+        send_message_kwargs["generation_config"] = (
+            generation_types.GenerationConfigDict(temperature=temperature)
+        )
+    return send_message_kwargs
+
+
+def genai_response_to_chat_completion(
+    response: "generation_types.BaseGenerateContentResponse",
+    *,
+    model: Text,
+    input_tokens: int,
+    out_tokens: int,
+) -> ChatCompletion:
+    """Convert a Gemini response to an OpenAI chat completion."""
+
+    return ChatCompletion.model_validate(
+        dict(
+            id=str(uuid.uuid4()),
+            choices=[
+                dict(
+                    finish_reason="stop",
+                    index=idx,
+                    message=dict(content=part.text, role="assistant"),
+                )
+                for idx, part in enumerate(response.parts)
+                if part.text
+            ],
+            created=int(time.time()),
+            model=model,
+            object="chat.completion",
+            usage=dict(
+                completion_tokens=out_tokens,
+                prompt_tokens=input_tokens,
+                total_tokens=input_tokens + out_tokens,
+            ),
+        )
+    )
+
+
+def genai_chunk_to_chat_completion_chunk(
+    generate_content_chunk: Optional["generation_types.BaseGenerateContentResponse"],
+    *,
+    model: Text,
+    created: int,
+    chat_completion_id: Text,
+) -> ChatCompletionChunk:
+    """Convert a Gemini stream chunk to an OpenAI chat completion chunk.
+
+    The final chunk with `finish_reason` is returned if the chunk is None.
+    """
+
+    if generate_content_chunk is None:
+        choice = {"index": 0, "delta": {}, "finish_reason": "stop"}
+    else:
+        parts_content = "\n".join(
+            p.text for p in generate_content_chunk.candidates[0].content.parts
+        )
+        choice = {
+            "index": 0,
+            "delta": {"content": parts_content, "role": "assistant"},
+        }
+    return ChatCompletionChunk.model_validate(
+        {
+            "id": chat_completion_id,
+            "choices": [choice],
+            "created": created,
+            "model": model,
+            "object": "chat.completion.chunk",
+        }
+    )
@@ -1,10 +1,13 @@
 from contextlib import contextmanager
-from typing import Text, Type
+from typing import List, Optional, Text, Tuple, Type
 
 import sqlalchemy as sa
+from openai.types.beta.assistant import Assistant
+from openai.types.beta.threads.message import Message
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
 from yarl import URL
 
+from languru.exceptions import NotFound
 from languru.resources.sql.openai.backend.assistants import (
     Assistants as AssistantsBackend,
 )
@@ -57,5 +60,36 @@ class OpenaiBackend:
         finally:
             session.close()
 
+    def retrieve_assistant_and_list_messages(
+        self,
+        assistant_id: Text,
+        thread_id: Text,
+        *,
+        messages_limit: Optional[int] = None,
+    ) -> Tuple["Assistant", List["Message"]]:
+        """Retrieve an assistant and list the thread messages in one session.
+
+        Only the newest `messages_limit` messages are loaded when it is set.
+        """
+
+        orm_assistant_model = self.assistants.orm_model
+        orm_message_model = self.threads.messages.orm_model
+        with self.sql_session() as session:
+            orm_assistant = (
+                session.query(orm_assistant_model)
+                .filter(orm_assistant_model.id == assistant_id)
+                .one_or_none()
+            )
+            if orm_assistant is None:
+                raise NotFound(f"Assistant with ID {assistant_id} not found.")
+            orm_messages = (
+                session.query(orm_message_model)
+                .filter(orm_message_model.thread_id == thread_id)
+                .order_by(orm_message_model.created_at.desc())
+                .limit(messages_limit)
+                .all()
+            )
+            return (orm_assistant.to_openai(), [m.to_openai() for m in orm_messages])
+
     def touch(self):
         self._sql_base.metadata.create_all(self.sql_engine)
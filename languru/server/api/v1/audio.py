@@ -1,4 +1,4 @@
-from typing import Optional, Text, Tuple
+from typing import Any, AsyncGenerator, Dict, Optional, Text, Tuple, Union
 
 from fastapi import (
     APIRouter,
@@ -11,7 +11,7 @@ from fastapi import (
     UploadFile,
 )
 from fastapi.responses import StreamingResponse
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 from openai.types.audio import Transcription, Translation
 from pyassorted.asyncio.executor import run_func, run_generator
 
@@ -59,30 +59,48 @@ def depends_openai_client_audio_speech_request(
             },
         },
     ),
-) -> Tuple[OpenAI, AudioSpeechRequest]:
+) -> Tuple[Union[OpenAI, AsyncOpenAI], AudioSpeechRequest]:
     if org_type is None:
         org_type = openai_clients.org_from_model(audio_speech_request.model)
 
     if org_type is None:
         raise HTTPException(status_code=400, detail="Organization type not found.")
     else:
-        openai_client = openai_clients.org_to_openai_client(org_type)
+        openai_client = openai_clients.org_to_preferred_openai_client(org_type)
         return (openai_client, audio_speech_request)
 
 
+async def aiter_audio_speech_bytes(
+    openai_client: "AsyncOpenAI", params: Dict[Text, Any]
+) -> AsyncGenerator[bytes, None]:
+    """Stream the speech bytes, keeping the upstream response open until done."""
+
+    async with openai_client.audio.speech.with_streaming_response.create(
+        **params
+    ) as response:
+        async for chunk in response.iter_bytes():
+            yield chunk
+
+
 class AudioSpeechHandler:
     async def handle_request(
         self,
         request: "Request",
         *args,
         audio_speech_request: "AudioSpeechRequest",
-        openai_client: "OpenAI",
+        openai_client: Union["OpenAI", "AsyncOpenAI"],
         settings: "ServerBaseSettings",
         **kwargs,
     ) -> StreamingResponse:
+        params = audio_speech_request.model_dump(exclude_none=True)
+        if isinstance(openai_client, AsyncOpenAI):
+            return StreamingResponse(
+                aiter_audio_speech_bytes(openai_client, params),
+                media_type="audio/mpeg",
+            )
         # Request audio speech
         with openai_client.audio.speech.with_streaming_response.create(
-            **audio_speech_request.model_dump(exclude_none=True)
+            **params
         ) as response:
             return StreamingResponse(
                 run_generator(dummy_generator_func(response.iter_bytes())),
@@ -123,9 +141,9 @@ class AudioTranslationHandler:
 @router.post("/audio/speech")
 async def audio_speech(
     request: Request,
-    openai_client_audio_speech_request: Tuple[OpenAI, AudioSpeechRequest] = Depends(
-        depends_openai_client_audio_speech_request
-    ),
+    openai_client_audio_speech_request: Tuple[
+        Union[OpenAI, AsyncOpenAI], AudioSpeechRequest
+    ] = Depends(depends_openai_client_audio_speech_request),
     settings: ServerBaseSettings = Depends(app_settings),
 ) -> StreamingResponse:
     return await AudioSpeechHandler().handle_request(
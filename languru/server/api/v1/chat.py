@@ -1,18 +1,25 @@
-from typing import Tuple
+from typing import Tuple, Union
 
 from fastapi import APIRouter, Depends, Request
-from fastapi.responses import StreamingResponse
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 from openai.types.chat import ChatCompletion
 from pyassorted.asyncio.executor import run_func, run_generator
+from starlette.background import BackgroundTask
 
 from languru.server.config import ServerBaseSettings
 from languru.server.deps.common import app_settings
 from languru.server.deps.openai_chat import (
     depends_openai_client_chat_completion_request,
 )
+from languru.server.deps.openai_clients import openai_clients
+from languru.server.utils.responses import SSEStreamingResponse
 from languru.types.chat.completions import ChatCompletionRequest
-from languru.utils.http import simple_sse_encode
+from languru.types.organizations import OrganizationType
+from languru.utils.http import (
+    acoalesce_sse_chunks,
+    asimple_sse_encode,
+    simple_sse_encode,
+)
 
 router = APIRouter()
 
@@ -25,15 +32,17 @@ class ChatCompletionHandler:
         *args,
         chat_completion_request: "ChatCompletionRequest",
         settings: "ServerBaseSettings",
-        openai_client: "OpenAI",
+        openai_client: Union["OpenAI", "AsyncOpenAI"],
+        org_type: "OrganizationType",
         **kwargs,
-    ) -> ChatCompletion | StreamingResponse:
+    ) -> ChatCompletion | SSEStreamingResponse:
         if chat_completion_request.stream is True:
             return await self.handle_stream(
                 request=request,
                 chat_completion_request=chat_completion_request,
                 settings=settings,
                 openai_client=openai_client,
+                org_type=org_type,
                 **kwargs,
             )
         else:
@@ -42,6 +51,7 @@ class ChatCompletionHandler:
                 chat_completion_request=chat_completion_request,
                 settings=settings,
                 openai_client=openai_client,
+                org_type=org_type,
                 **kwargs,
             )
 
@@ -51,15 +61,23 @@ class ChatCompletionHandler:
         *args,
         chat_completion_request: "ChatCompletionRequest",
         settings: "ServerBaseSettings",
-        openai_client: "OpenAI",
+        openai_client: Union["OpenAI", "AsyncOpenAI"],
+        org_type: "OrganizationType",
         **kwargs,
     ) -> ChatCompletion:
-        params = chat_completion_request.model_dump(exclude_none=True)
-        params["stream"] = False
-        chat_completion = await run_func(
-            openai_client.chat.completions.create, **params
+        params = chat_completion_request.model_dump(
+            exclude_none=True, exclude={"stream"}
         )
-        return chat_completion
+        async with openai_clients.admission_controller(
+            org_type, max_limit=settings.UPSTREAM_CONCURRENCY_LIMIT
+        ).slot():
+            if isinstance(openai_client, AsyncOpenAI):
+                return await openai_client.chat.completions.create(
+                    **params, stream=False
+                )
+            return await run_func(
+                openai_client.chat.completions.create, **params, stream=False
+            )
 
     async def handle_stream(
         self,
@@ -67,25 +85,37 @@ class ChatCompletionHandler:
         *args,
         chat_completion_request: "ChatCompletionRequest",
         settings: "ServerBaseSettings",
-        openai_client: "OpenAI",
+        openai_client: Union["OpenAI", "AsyncOpenAI"],
+        org_type: "OrganizationType",
         **kwargs,
-    ) -> StreamingResponse:
-        params = chat_completion_request.model_dump(exclude_none=True)
-        params["stream"] = True
-        return StreamingResponse(
-            run_generator(
-                simple_sse_encode,
-                await run_func(openai_client.chat.completions.create, **params),
-            ),
-            media_type="application/stream+json",
+    ) -> SSEStreamingResponse:
+        params = chat_completion_request.model_dump(
+            exclude_none=True, exclude={"stream"}
         )
+        # The slot is held until the stream is consumed or closed
+        async with openai_clients.admission_controller(
+            org_type, max_limit=settings.UPSTREAM_CONCURRENCY_LIMIT
+        ).slot() as slot:
+            if isinstance(openai_client, AsyncOpenAI):
+                stream = await openai_client.chat.completions.create(
+                    **params, stream=True
+                )
+                content = acoalesce_sse_chunks(asimple_sse_encode(stream))
+            else:
+                stream = await run_func(
+                    openai_client.chat.completions.create, **params, stream=True
+                )
+                content = run_generator(simple_sse_encode, stream)
+            return SSEStreamingResponse(
+                slot.hold(content), background=BackgroundTask(slot.release)
+            )
 
 
 @router.post("/chat/completions")
 async def chat_completions(
     request: Request,
     openai_client_chat_completion_request: Tuple[
-        OpenAI, ChatCompletionRequest
+        Union[OpenAI, AsyncOpenAI], ChatCompletionRequest, OrganizationType
     ] = Depends(depends_openai_client_chat_completion_request),
     settings: ServerBaseSettings = Depends(app_settings),
 ):  # -> openai.types.chat.ChatCompletion | openai.types.chat.ChatCompletionChunk
@@ -94,4 +124,5 @@ async def chat_completions(
         chat_completion_request=openai_client_chat_completion_request[1],
         settings=settings,
         openai_client=openai_client_chat_completion_request[0],
+        org_type=openai_client_chat_completion_request[2],
     )
@@ -1,21 +1,27 @@
 from logging import Logger
-from typing import Optional, Tuple
+from typing import Optional, Tuple, Union
 
 from fastapi import APIRouter, Body, Depends, HTTPException, Request
-from fastapi.responses import StreamingResponse
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 from openai.types.completion import Completion
 from pyassorted.asyncio.executor import run_func, run_generator
+from starlette.background import BackgroundTask
 
 from languru.config import logger as languru_logger
+from languru.examples.openapi.completions import completion_openapi_examples
 from languru.server.config import ServerBaseSettings
 from languru.server.deps.common import app_settings
 from languru.server.deps.openai_clients import openai_clients
-from languru.server.utils.common import get_value_from_app
+from languru.server.utils.common import get_value_from_app, to_openapi_examples
+from languru.server.utils.responses import SSEStreamingResponse
 from languru.types.completions import CompletionRequest
 from languru.types.organizations import OrganizationType
 from languru.utils.common import display_object
-from languru.utils.http import simple_sse_encode
+from languru.utils.http import (
+    acoalesce_sse_chunks,
+    asimple_sse_encode,
+    simple_sse_encode,
+)
 
 router = APIRouter()
 
@@ -25,20 +31,9 @@ def depends_openai_client_completion_request(
     org_type: Optional[OrganizationType] = Depends(openai_clients.depends_org_type),
     completion_request: CompletionRequest = Body(
         ...,
-        openapi_examples={
-            "Quick text completion": {
-                "summary": "Quick text completion",
-                "description": "Text completion request",
-                "value": {
-                    "model": "gpt-3.5-turbo-instruct",
-                    "prompt": "Say this is a test",
-                    "max_tokens": 7,
-                    "temperature": 0,
-                },
-            },
-        },
+        openapi_examples=to_openapi_examples(completion_openapi_examples),
     ),
-) -> Tuple[OpenAI, CompletionRequest]:
+) -> Tuple[Union[OpenAI, AsyncOpenAI], CompletionRequest, OrganizationType]:
     logger = get_value_from_app(
         request.app, key="logger", value_typing=Logger, default=languru_logger
     )
@@ -48,7 +43,7 @@ def depends_openai_client_completion_request(
     if org_type is None:
         raise HTTPException(status_code=400, detail="Organization type not found.")
 
-    openai_client = openai_clients.org_to_openai_client(org_type)
+    openai_client = openai_clients.org_to_preferred_openai_client(org_type)
     completion_request.model = openai_clients.model_strip_org(
         completion_request.model, org_type
     )
@@ -57,7 +52,7 @@ def depends_openai_client_completion_request(
         + f"openAI client: '{display_object(openai_client)}', "
         + f"model: '{completion_request.model}'"
     )
-    return (openai_client, completion_request)
+    return (openai_client, completion_request, org_type)
 
 
 class TextCompletionHandler:
@@ -67,16 +62,18 @@ class TextCompletionHandler:
         request: "Request",
         *args,
         completion_request: "CompletionRequest",
-        openai_client: "OpenAI",
+        openai_client: Union["OpenAI", "AsyncOpenAI"],
+        org_type: "OrganizationType",
         settings: "ServerBaseSettings",
         **kwargs,
-    ) -> Completion | StreamingResponse:
+    ) -> Completion | SSEStreamingResponse:
         # Stream
         if completion_request.stream is True:
             return await self.handle_stream(
                 request=request,
                 completion_request=completion_request,
                 openai_client=openai_client,
+                org_type=org_type,
                 settings=settings,
                 **kwargs,
             )
@@ -86,6 +83,7 @@ class TextCompletionHandler:
                 request=request,
                 completion_request=completion_request,
                 openai_client=openai_client,
+                org_type=org_type,
                 settings=settings,
                 **kwargs,
             )
@@ -95,50 +93,65 @@ class TextCompletionHandler:
         request: "Request",
         *args,
         completion_request: "CompletionRequest",
-        openai_client: "OpenAI",
+        openai_client: Union["OpenAI", "AsyncOpenAI"],
+        org_type: "OrganizationType",
         settings: "ServerBaseSettings",
         **kwargs,
     ) -> Completion:
-        return await run_func(
-            openai_client.completions.create,
-            completion_request.model_dump(exclude_none=True),
-        )
+        completion_params = completion_request.model_dump(exclude_none=True)
+        async with openai_clients.admission_controller(
+            org_type, max_limit=settings.UPSTREAM_CONCURRENCY_LIMIT
+        ).slot():
+            if isinstance(openai_client, AsyncOpenAI):
+                return await openai_client.completions.create(**completion_params)
+            return await run_func(openai_client.completions.create, **completion_params)
 
     async def handle_stream(
         self,
         request: "Request",
         *args,
         completion_request: "CompletionRequest",
-        openai_client: "OpenAI",
+        openai_client: Union["OpenAI", "AsyncOpenAI"],
+        org_type: "OrganizationType",
         settings: "ServerBaseSettings",
         **kwargs,
-    ) -> StreamingResponse:
-        completion_stream_params = completion_request.model_dump(exclude_none=True)
-        completion_stream_params.pop("stream", None)
-        return StreamingResponse(
-            run_generator(
-                simple_sse_encode,
-                await run_func(
+    ) -> SSEStreamingResponse:
+        completion_stream_params = completion_request.model_dump(
+            exclude_none=True, exclude={"stream"}
+        )
+        # The slot is held until the stream is consumed or closed
+        async with openai_clients.admission_controller(
+            org_type, max_limit=settings.UPSTREAM_CONCURRENCY_LIMIT
+        ).slot() as slot:
+            if isinstance(openai_client, AsyncOpenAI):
+                stream = await openai_client.completions.create(
+                    **completion_stream_params, stream=True
+                )
+                content = acoalesce_sse_chunks(asimple_sse_encode(stream))
+            else:
+                stream = await run_func(
                     openai_client.completions.create,
                     **completion_stream_params,
                     stream=True,
-                ),
-            ),
-            media_type="application/stream+json",
-        )
+                )
+                content = run_generator(simple_sse_encode, stream)
+            return SSEStreamingResponse(
+                slot.hold(content), background=BackgroundTask(slot.release)
+            )
 
 
 @router.post("/completions")
 async def text_completions(
     request: Request,
-    openai_client_completion_request: Tuple[OpenAI, CompletionRequest] = Depends(
-        depends_openai_client_completion_request
-    ),
+    openai_client_completion_request: Tuple[
+        Union[OpenAI, AsyncOpenAI], CompletionRequest, OrganizationType
+    ] = Depends(depends_openai_client_completion_request),
     settings: ServerBaseSettings = Depends(app_settings),
 ):  # openai.types.Completion
     return await TextCompletionHandler().handle_request(
         request=request,
         completion_request=openai_client_completion_request[1],
         openai_client=openai_client_completion_request[0],
+        org_type=openai_client_completion_request[2],
         settings=settings,
     )
@@ -1,16 +1,17 @@
 from logging import Logger
-from typing import Optional, Tuple
+from typing import Optional, Tuple, Union
 
 from fastapi import APIRouter, Body, Depends, HTTPException, Request
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 from openai.types import CreateEmbeddingResponse
 from pyassorted.asyncio.executor import run_func
 
 from languru.config import logger as languru_logger
+from languru.examples.openapi.embeddings import embedding_openapi_examples
 from languru.server.config import ServerBaseSettings
 from languru.server.deps.common import app_settings
 from languru.server.deps.openai_clients import openai_clients
-from languru.server.utils.common import get_value_from_app
+from languru.server.utils.common import get_value_from_app, to_openapi_examples
 from languru.types.embeddings import EmbeddingRequest
 from languru.types.organizations import OrganizationType
 from languru.utils.common import display_object
@@ -23,18 +24,9 @@ def depends_openai_client_embedding_request(
     org_type: Optional[OrganizationType] = Depends(openai_clients.depends_org_type),
     embedding_request: EmbeddingRequest = Body(
         ...,
-        openapi_examples={
-            "Quick embedding": {
-                "summary": "Quick embedding",
-                "description": "Embedding request",
-                "value": {
-                    "model": "text-embedding-ada-002",
-                    "input": "The food was delicious and the waiter...",
-                },
-            }
-        },
+        openapi_examples=to_openapi_examples(embedding_openapi_examples),
     ),
-) -> Tuple[OpenAI, EmbeddingRequest]:
+) -> Tuple[Union[OpenAI, AsyncOpenAI], EmbeddingRequest, OrganizationType]:
     logger = get_value_from_app(
         request.app, key="logger", value_typing=Logger, default=languru_logger
     )
@@ -44,7 +36,7 @@ def depends_openai_client_embedding_request(
     if org_type is None:
         raise HTTPException(status_code=400, detail="Organization type not found.")
 
-    openai_client = openai_clients.org_to_openai_client(org_type)
+    openai_client = openai_clients.org_to_preferred_openai_client(org_type)
     embedding_request.model = openai_clients.model_strip_org(
         embedding_request.model, org_type
     )
@@ -53,7 +45,7 @@ def depends_openai_client_embedding_request(
         + f"openAI client: '{display_object(openai_client)}', "
         + f"model: '{embedding_request.model}'"
     )
-    return (openai_client, embedding_request)
+    return (openai_client, embedding_request, org_type)
 
 
 class EmbeddingHandler:
@@ -62,27 +54,32 @@ class EmbeddingHandler:
         request: "Request",
         *args,
         embedding_request: "EmbeddingRequest",
-        openai_client: "OpenAI",
+        openai_client: Union["OpenAI", "AsyncOpenAI"],
+        org_type: "OrganizationType",
         settings: "ServerBaseSettings",
         **kwargs,
     ) -> "CreateEmbeddingResponse":
-        return await run_func(
-            openai_client.embeddings.create,
-            **embedding_request.model_dump(exclude_none=True),
-        )
+        embedding_params = embedding_request.model_dump(exclude_none=True)
+        async with openai_clients.admission_controller(
+            org_type, max_limit=settings.UPSTREAM_CONCURRENCY_LIMIT
+        ).slot():
+            if isinstance(openai_client, AsyncOpenAI):
+                return await openai_client.embeddings.create(**embedding_params)
+            return await run_func(openai_client.embeddings.create, **embedding_params)
 
 
 @router.post("/embeddings")
 async def text_completions(
     request: Request,
-    openai_client_embedding_request: Tuple[OpenAI, EmbeddingRequest] = Depends(
-        depends_openai_client_embedding_request
-    ),
+    openai_client_embedding_request: Tuple[
+        Union[OpenAI, AsyncOpenAI], EmbeddingRequest, OrganizationType
+    ] = Depends(depends_openai_client_embedding_request),
     settings: ServerBaseSettings = Depends(app_settings),
 ) -> CreateEmbeddingResponse:
     return await EmbeddingHandler().handle_request(
         request=request,
         embedding_request=openai_client_embedding_request[1],
         openai_client=openai_client_embedding_request[0],
+        org_type=openai_client_embedding_request[2],
         settings=settings,
     )
@@ -50,7 +50,7 @@ class RetrieveModelHandler:
 
         if len(models_list) == 0:
             raise HTTPException(status_code=404, detail="Model not found")
-        return Model.model_validate(models_list[0].model_dump())
+        return Model.model_validate(models_list[0], from_attributes=True)
 
 
 @router.get("/models", summary="List models")
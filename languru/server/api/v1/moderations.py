@@ -1,8 +1,9 @@
 from logging import Logger
-from typing import Optional, Tuple
+from typing import Optional, Tuple, Union
 
-from fastapi import APIRouter, Body, Depends, HTTPException, Request
-from openai import OpenAI
+import orjson
+from fastapi import APIRouter, Body, Depends, HTTPException, Request, Response
+from openai import AsyncOpenAI, OpenAI
 from openai.types.moderation import (
     Categories,
     CategoryAppliedInputTypes,
@@ -13,31 +14,35 @@ from pyassorted.asyncio.executor import run_func
 from pydantic import BaseModel
 
 from languru.config import logger as languru_logger
+from languru.examples.openapi.moderations import moderation_openapi_examples
 from languru.server.config import ServerBaseSettings
 from languru.server.deps.common import app_settings
 from languru.server.deps.openai_clients import openai_clients
-from languru.server.utils.common import get_value_from_app
+from languru.server.utils.common import get_value_from_app, to_openapi_examples
 from languru.types.moderations import ModerationRequest
 from languru.types.organizations import OrganizationType
 from languru.utils.common import display_object
 
 router = APIRouter()
 
+# Response keys the OpenAI types require but some providers leave out
+CATEGORIES_KEYS = tuple(v.alias or k for k, v in Categories.model_fields.items())
+CATEGORY_SCORES_KEYS = tuple(
+    v.alias or k for k, v in CategoryScores.model_fields.items()
+)
+CATEGORY_APPLIED_INPUT_TYPES_KEYS = tuple(
+    v.alias or k for k, v in CategoryAppliedInputTypes.model_fields.items()
+)
+
 
 def depends_openai_client_moderation_request(
     request: "Request",
     org_type: Optional[OrganizationType] = Depends(openai_clients.depends_org_type),
     moderation_request: ModerationRequest = Body(
         ...,
-        openapi_examples={
-            "Quick example": {
-                "summary": "A quick example of a moderation request",
-                "description": "A quick example of a moderation request",
-                "value": {"input": "I want to kill them."},
-            }
-        },
+        openapi_examples=to_openapi_examples(moderation_openapi_examples),
     ),
-) -> Tuple[OpenAI, ModerationRequest]:
+) -> Tuple[Union[OpenAI, AsyncOpenAI], ModerationRequest, OrganizationType]:
     logger = get_value_from_app(
         request.app, key="logger", value_typing=Logger, default=languru_logger
     )
@@ -49,7 +54,7 @@ def depends_openai_client_moderation_request(
     if org_type is None:
         raise HTTPException(status_code=400, detail="Organization type not found.")
 
-    openai_client = openai_clients.org_to_openai_client(org_type)
+    openai_client = openai_clients.org_to_preferred_openai_client(org_type)
     if moderation_request.model is not None:
         moderation_request.model = openai_clients.model_strip_org(
             moderation_request.model, org_type
@@ -59,7 +64,7 @@ def depends_openai_client_moderation_request(
         + f"openAI client: '{display_object(openai_client)}', "
         + f"model: '{moderation_request.model}'"
     )
-    return (openai_client, moderation_request)
+    return (openai_client, moderation_request, org_type)
 
 
 class ModerationsHandler:
@@ -68,27 +73,32 @@ class ModerationsHandler:
         request: "Request",
         *args,
         moderation_request: "ModerationRequest",
-        openai_client: "OpenAI",
+        openai_client: Union["OpenAI", "AsyncOpenAI"],
+        org_type: "OrganizationType",
         settings: "ServerBaseSettings",
     ) -> "ModerationCreateResponse":
-        return await run_func(
-            openai_client.moderations.create,
-            **moderation_request.model_dump(exclude_none=True),
-        )
+        moderation_params = moderation_request.model_dump(exclude_none=True)
+        async with openai_clients.admission_controller(
+            org_type, max_limit=settings.UPSTREAM_CONCURRENCY_LIMIT
+        ).slot():
+            if isinstance(openai_client, AsyncOpenAI):
+                return await openai_client.moderations.create(**moderation_params)
+            return await run_func(openai_client.moderations.create, **moderation_params)
 
 
-@router.post("/moderations")
+@router.post("/moderations", response_model=ModerationCreateResponse)
 async def request_moderations(
     request: Request,
-    openai_client_moderation_request: Tuple[OpenAI, ModerationRequest] = Depends(
-        depends_openai_client_moderation_request
-    ),
+    openai_client_moderation_request: Tuple[
+        Union[OpenAI, AsyncOpenAI], ModerationRequest, OrganizationType
+    ] = Depends(depends_openai_client_moderation_request),
     settings: ServerBaseSettings = Depends(app_settings),
-) -> ModerationCreateResponse:
+) -> Response:
     response = await ModerationsHandler().handle_moderations_request(
         request=request,
         moderation_request=openai_client_moderation_request[1],
         openai_client=openai_client_moderation_request[0],
+        org_type=openai_client_moderation_request[2],
         settings=settings,
     )
 
@@ -101,29 +111,25 @@ async def request_moderations(
     )
     for result in data["results"]:
         # Categories
-        for k, v in Categories.model_fields.items():
-            _key = v.alias or k
-            if _key in result["categories"]:
-                if result["categories"][_key] is None:
-                    result["categories"][_key] = False
-            else:
-                result["categories"][_key] = False
+        categories = result["categories"]
+        for _key in CATEGORIES_KEYS:
+            if categories.get(_key) is None:
+                categories[_key] = False
         # CategoryScores
-        for k, v in CategoryScores.model_fields.items():
-            _key = v.alias or k
-            if _key in result["category_scores"]:
-                if result["category_scores"][_key] is None:
-                    result["category_scores"][_key] = 0.0
-            else:
-                result["category_scores"][_key] = 0.0
+        category_scores = result["category_scores"]
+        for _key in CATEGORY_SCORES_KEYS:
+            if category_scores.get(_key) is None:
+                category_scores[_key] = 0.0
         # CategoryAppliedInputTypes
         if (
             "category_applied_input_types" not in result
             or result["category_applied_input_types"] is None
         ):
             result["category_applied_input_types"] = {
-                v.alias or k: []
-                for k, v in CategoryAppliedInputTypes.model_fields.items()
+                _key: [] for _key in CATEGORY_APPLIED_INPUT_TYPES_KEYS
             }
 
-    return ModerationCreateResponse.model_validate(data)
+    # Forward the patched payload as is, only validating it while debugging
+    if settings.debug:
+        ModerationCreateResponse.model_validate(data)
+    return Response(content=orjson.dumps(data), media_type="application/json")
@@ -1,10 +1,8 @@
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
-from httpx import Response
-from openai._legacy_response import HttpxBinaryResponseContent
-from openai.resources.audio.speech import Speech
+from openai.resources.audio.speech import AsyncSpeech
 from openai.resources.audio.transcriptions import Transcriptions
 from openai.resources.audio.translations import Translations
 from openai.types.audio import Transcription, Translation
@@ -24,16 +22,21 @@ def test_client():
         yield client
 
 
+class StreamedSpeechResponse:
+    async def iter_bytes(self, chunk_size=None):
+        for chunk in (b"bytes ", b"chunks"):
+            yield chunk
+
+    async def close(self):
+        pass
+
+
 @pytest.fixture
 def mocked_openai_speech_response_create():
-    httpx_res = Response(200)
-    httpx_res._content = b"bytes chunks"
-    httpx_binary_res_content = HttpxBinaryResponseContent(httpx_res)
-
     with patch.object(
-        Speech,
+        AsyncSpeech,
         "create",
-        MagicMock(return_value=httpx_binary_res_content),
+        AsyncMock(return_value=StreamedSpeechResponse()),
     ):
         yield
 
@@ -66,6 +69,7 @@ def test_app_audio_speech(test_client, mocked_openai_speech_response_create):
         "/v1/audio/speech", json=request_call.model_dump(exclude_none=True)
     )
     assert response.status_code == 200
+    assert response.content == b"bytes chunks"
 
 
 def test_app_audio_transcriptions(
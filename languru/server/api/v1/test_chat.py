@@ -1,5 +1,5 @@
 import json
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
@@ -15,28 +15,32 @@ def test_client():
 
 @pytest.fixture
 def mocked_openai_chat_completion_create():
-    from openai.resources.chat.completions import Completions as OpenaiCompletions
+    from openai.resources.chat.completions import AsyncCompletions
 
     from languru.examples.return_values._openai import return_chat_completion
 
     with patch.object(
-        OpenaiCompletions,
+        AsyncCompletions,
         "create",
-        MagicMock(return_value=return_chat_completion),
+        AsyncMock(return_value=return_chat_completion),
     ):
         yield
 
 
 @pytest.fixture
 def mocked_openai_chat_completion_create_stream():
-    from openai.resources.chat.completions import Completions as OpenaiCompletions
+    from openai.resources.chat.completions import AsyncCompletions
 
     from languru.examples.return_values._openai import return_chat_completion_chunks
 
+    async def _stream():
+        for chunk in return_chat_completion_chunks:
+            yield chunk
+
     with patch.object(
-        OpenaiCompletions,
+        AsyncCompletions,
         "create",
-        MagicMock(return_value=return_chat_completion_chunks),
+        AsyncMock(return_value=_stream()),
     ):
         yield
 
@@ -1,5 +1,5 @@
 import json
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
@@ -17,28 +17,32 @@ def test_client():
 
 @pytest.fixture
 def mocked_openai_text_completion_create():
-    from openai.resources.completions import Completions as OpenaiCompletions
+    from openai.resources.completions import AsyncCompletions
 
     from languru.examples.return_values._openai import return_text_completion
 
     with patch.object(
-        OpenaiCompletions,
+        AsyncCompletions,
         "create",
-        MagicMock(return_value=return_text_completion),
+        AsyncMock(return_value=return_text_completion),
     ):
         yield
 
 
 @pytest.fixture
 def mocked_openai_text_completion_create_stream():
-    from openai.resources.completions import Completions as OpenaiCompletions
+    from openai.resources.completions import AsyncCompletions
 
     from languru.examples.return_values._openai import return_text_completion_stream
 
+    async def _stream():
+        for chunk in return_text_completion_stream:
+            yield chunk
+
     with patch.object(
-        OpenaiCompletions,
+        AsyncCompletions,
         "create",
-        MagicMock(return_value=return_text_completion_stream),
+        AsyncMock(return_value=_stream()),
     ):
         yield
 
@@ -68,6 +72,9 @@ def test_app_text_completions_stream(
     with test_client.stream(
         "POST", url="/v1/completions", json=completion_call
     ) as response:
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert response.headers["x-accel-buffering"] == "no"
+        assert "connection" not in response.headers
         answer = ""
         for line in response.iter_lines():
             line = line.replace("data:", "", 1).strip()
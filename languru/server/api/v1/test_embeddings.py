@@ -1,4 +1,4 @@
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
@@ -16,19 +16,19 @@ def test_client():
 
 @pytest.fixture
 def mocked_openai_embeddings_create():
-    from openai.resources.embeddings import Embeddings as OpenaiEmbeddings
+    from openai.resources.embeddings import AsyncEmbeddings
 
     from languru.examples.return_values._openai import return_embedding
 
     with patch.object(
-        OpenaiEmbeddings,
+        AsyncEmbeddings,
         "create",
-        MagicMock(return_value=return_embedding),
+        AsyncMock(return_value=return_embedding),
     ):
         yield
 
 
-def test_app_embedding(test_client):
+def test_app_embedding(test_client, mocked_openai_embeddings_create):
     embedding_call = {
         "input": ["Hello", "world!"],
         "model": test_model_name,
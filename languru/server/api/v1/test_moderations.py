@@ -1,7 +1,8 @@
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
+from openai.types.moderation_create_response import ModerationCreateResponse
 
 
 @pytest.fixture(scope="module")
@@ -14,12 +15,12 @@ def test_client():
 
 @pytest.fixture
 def mocked_openai_moderation_create():
-    from openai.resources.moderations import Moderations
+    from openai.resources.moderations import AsyncModerations
 
     from languru.examples.return_values._openai import return_moderation_create
 
     with patch.object(
-        Moderations, "create", MagicMock(return_value=return_moderation_create)
+        AsyncModerations, "create", AsyncMock(return_value=return_moderation_create)
     ):
         yield
 
@@ -28,3 +29,5 @@ def test_app_moderation(test_client, mocked_openai_moderation_create):
     moderation_call = {"input": "I want to kill them."}
     response = test_client.post("/v1/moderations", json=moderation_call)
     assert response.status_code == 200
+    moderation = ModerationCreateResponse.model_validate(response.json())
+    assert moderation.results[0].flagged is not None
@@ -19,7 +19,7 @@ from languru.server.config import (
     init_paths,
     pretty_print_app_routes,
 )
-from languru.server.deps.openai_clients import OpenaiClients
+from languru.server.deps.openai_clients import OpenaiClients, openai_clients
 from languru.server.utils.common import get_value_from_app
 
 
@@ -37,10 +37,14 @@ async def app_lifespan(app: FastAPI):
         app, key=APP_STATE_OPENAI_BACKEND, value_typing=OpenaiBackend
     )
     openai_backend.touch()
+    openai_clients.open_async_openai_clients()  # Pool bound to this event loop
 
     # Yield
-    with refresh_executor_of_app(app):  # Refresh thread pool executor
-        yield
+    try:
+        with refresh_executor_of_app(app):  # Refresh thread pool executor
+            yield
+    finally:
+        await openai_clients.aclose_async_openai_clients()
 
 
 def create_app(settings: "ServerBaseSettings", **kwargs):
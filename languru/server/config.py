@@ -3,7 +3,7 @@ import logging.config
 import os
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Final, Text
+from typing import TYPE_CHECKING, Final, Optional, Text
 
 import pytz
 from colorama import Fore, Style, init
@@ -53,6 +53,14 @@ class ServerBaseSettings(BaseSettings):
     # Backend configuration
     OPENAI_BACKEND_URL: Text = "sqlite:///data/openai.db"
 
+    # Threads runs configuration
+    # The newest messages of the thread loaded as the run context, all if None
+    THREADS_RUN_MESSAGES_LIMIT: Optional[int] = None
+
+    # Upstream calls configuration
+    # The maximum concurrent calls to each organization, halved on rate limits
+    UPSTREAM_CONCURRENCY_LIMIT: int = 64
+
     # Resources configuration
     openai_available: bool = True if os.environ.get("OPENAI_API_KEY") else False
 
@@ -1,12 +1,12 @@
 from logging import Logger
-from typing import Optional, Tuple
+from typing import Optional, Tuple, Union
 
 from fastapi import Body, Depends, Request
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 
 from languru.config import logger as languru_logger
 from languru.examples.openapi.chat import chat_openapi_examples
-from languru.server.deps.openai_clients import openai_client_from_model, openai_clients
+from languru.server.deps.openai_clients import openai_clients, org_type_from_model
 from languru.server.utils.common import get_value_from_app, to_openapi_examples
 from languru.types.chat.completions import ChatCompletionRequest
 from languru.types.organizations import OrganizationType
@@ -20,16 +20,17 @@ def depends_openai_client_chat_completion_request(
         ...,
         openapi_examples=to_openapi_examples(chat_openapi_examples),
     ),
-) -> Tuple[OpenAI, ChatCompletionRequest]:
-    """Returns the OpenAI client and the chat completion request."""
+) -> Tuple[Union[OpenAI, AsyncOpenAI], ChatCompletionRequest, OrganizationType]:
+    """Returns the OpenAI client, the chat completion request and the org type."""
 
     logger = get_value_from_app(
         request.app, key="logger", value_typing=Logger, default=languru_logger
     )
 
-    openai_client, org_type, chat_completion_request.model = openai_client_from_model(
+    org_type, chat_completion_request.model = org_type_from_model(
         chat_completion_request.model, org_type=org_type
     )
+    openai_client = openai_clients.org_to_preferred_openai_client(org_type)
 
     logger.debug(
         "Depends OpenAI client chat completion request: "
@@ -37,4 +38,4 @@ def depends_openai_client_chat_completion_request(
         + f"openAI client: '{display_object(openai_client)}', "
         + f"model: '{chat_completion_request.model}'"
     )
-    return (openai_client, chat_completion_request)
+    return (openai_client, chat_completion_request, org_type)
@@ -1,10 +1,19 @@
+import functools
 import time
 from logging import Logger
 from typing import Any, Dict, List, Optional, Sequence, Text, Tuple, Union
 
+import httpx
 from fastapi import Query, Request
 from fastapi.exceptions import HTTPException
-from openai import AzureOpenAI, OpenAI, OpenAIError
+from openai import (
+    AsyncAzureOpenAI,
+    AsyncOpenAI,
+    AzureOpenAI,
+    DefaultAsyncHttpxClient,
+    OpenAI,
+    OpenAIError,
+)
 from openai.types import Model
 from pydantic import BaseModel
 
@@ -20,6 +29,7 @@ from languru.openai_plugins.clients.groq import GroqOpenAI
 from languru.openai_plugins.clients.pplx import PerplexityOpenAI
 from languru.openai_plugins.clients.voyage import VoyageOpenAI
 from languru.server.config import APP_STATE_LOGGER
+from languru.server.utils.admission import AdmissionController
 from languru.server.utils.common import get_value_from_app
 from languru.types.models import (
     MODELS_ANTHROPIC,
@@ -32,6 +42,23 @@ from languru.types.models import (
 )
 from languru.types.organizations import OrganizationType, to_org_type
 
+ASYNC_HTTP_CONNECTION_LIMITS = httpx.Limits(
+    max_connections=1000, max_keepalive_connections=50, keepalive_expiry=30
+)
+
+
+@functools.lru_cache(maxsize=256)
+def strip_model_org(model: Text, org: Optional[OrganizationType] = None) -> Text:
+    """Strips the organization prefix from the model name, cached per pair."""
+
+    orgs = [org] if org is not None else list(OrganizationType)
+    model = model.strip()
+    model_lower = model.lower()
+    for _org in orgs:
+        if model_lower.startswith(f"{_org.value.lower()}/"):
+            return model.split("/", 1)[-1]
+    return model
+
 
 class OpenaiModels:
     _models: List[Model]
@@ -89,16 +116,7 @@ class OpenaiModels:
     ) -> Text:
         """Strips the organization type from the model name."""
 
-        orgs: List[OrganizationType] = [
-            to_org_type(o) if isinstance(o, Text) else o
-            for o in ([org] if org is not None else list(OrganizationType))
-        ]
-        model = model.strip()
-        model_lower = model.lower()
-        for _org in orgs:
-            if model_lower.startswith(f"{_org.value.lower()}/"):
-                return model.split("/", 1)[-1]
-        return model
+        return strip_model_org(model, to_org_type(org) if org is not None else None)
 
 
 class OpenaiDepends:
@@ -139,7 +157,19 @@ class OpenaiClients(OpenaiModels, OpenaiDepends):
         self._gq_client: Optional["GroqOpenAI"] = None
         self._pplx_client: Optional["PerplexityOpenAI"] = None
         self._vg_client: Optional["VoyageOpenAI"] = None
+        self._async_oai_client: Optional["AsyncOpenAI"] = None
+        self._async_aoai_client: Optional["AsyncAzureOpenAI"] = None
+        # Connection pool of the async clients, bound to the app lifespan
+        self._async_http_client: Optional["httpx.AsyncClient"] = None
         self._models: List["Model"] = []
+        # Supported model name to the first initialized organization serving it
+        self._model_orgs: Dict[Text, OrganizationType] = {}
+        # Organization type to the client the server endpoints should call
+        self._preferred_clients: Dict[
+            OrganizationType, Union["OpenAI", "AsyncOpenAI"]
+        ] = {}
+        # Organization type to the controller bounding its concurrent calls
+        self._admission_controllers: Dict[OrganizationType, AdmissionController] = {}
 
         self.init_openai_clients()
 
@@ -167,6 +197,7 @@ class OpenaiClients(OpenaiModels, OpenaiDepends):
                 for m in MODELS_OPENAI
             ]
             self.model_add(_models)
+            self.model_orgs_add(MODELS_OPENAI, OrganizationType.OPENAI)
         except OpenAIError:
             languru_logger.warning("OpenAI client not initialized.")
 
@@ -185,6 +216,7 @@ class OpenaiClients(OpenaiModels, OpenaiDepends):
                 for m in MODELS_AZURE_OPENAI
             ]
             self.model_add(_models)
+            self.model_orgs_add(MODELS_AZURE_OPENAI, OrganizationType.AZURE)
         except OpenAIError:
             languru_logger.warning("Azure OpenAI client not initialized.")
 
@@ -203,6 +235,7 @@ class OpenaiClients(OpenaiModels, OpenaiDepends):
                 for m in MODELS_ANTHROPIC
             ]
             self.model_add(_models)
+            self.model_orgs_add(MODELS_ANTHROPIC, OrganizationType.ANTHROPIC)
         except CredentialsNotProvided:
             languru_logger.warning("Anthropic OpenAI client not initialized.")
 
@@ -221,6 +254,7 @@ class OpenaiClients(OpenaiModels, OpenaiDepends):
                 for m in MODELS_GOOGLE
             ]
             self.model_add(_models)
+            self.model_orgs_add(MODELS_GOOGLE, OrganizationType.GOOGLE)
         except CredentialsNotProvided:
             languru_logger.warning("Google OpenAI client not initialized.")
 
@@ -239,6 +273,7 @@ class OpenaiClients(OpenaiModels, OpenaiDepends):
                 for m in MODELS_GROQ
             ]
             self.model_add(_models)
+            self.model_orgs_add(MODELS_GROQ, OrganizationType.GROQ)
         except CredentialsNotProvided:
             languru_logger.warning("Groq OpenAI client not initialized.")
 
@@ -257,6 +292,7 @@ class OpenaiClients(OpenaiModels, OpenaiDepends):
                 for m in MODELS_PERPLEXITY
             ]
             self.model_add(_models)
+            self.model_orgs_add(MODELS_PERPLEXITY, OrganizationType.PERPLEXITY)
         except CredentialsNotProvided:
             languru_logger.warning("Perplexity OpenAI client not initialized.")
 
@@ -275,6 +311,7 @@ class OpenaiClients(OpenaiModels, OpenaiDepends):
                 for m in MODELS_VOYAGE
             ]
             self.model_add(_models)
+            self.model_orgs_add(MODELS_VOYAGE, OrganizationType.VOYAGE)
         except CredentialsNotProvided:
             languru_logger.warning("Voyage OpenAI client not initialized.")
 
@@ -299,41 +336,23 @@ class OpenaiClients(OpenaiModels, OpenaiDepends):
         if _model is None:
             return None
         # Try search supported models
-        organization_type: Optional[OrganizationType] = None
-        for _c, _org in (
-            (self._oai_client, OrganizationType.OPENAI),
-            (self._aoai_client, OrganizationType.AZURE),
-            (self._ant_client, OrganizationType.ANTHROPIC),
-            (self._gg_client, OrganizationType.GOOGLE),
-            (self._gq_client, OrganizationType.GROQ),
-            (self._pplx_client, OrganizationType.PERPLEXITY),
-            (self._vg_client, OrganizationType.VOYAGE),
-        ):
-            if _c is None:
-                continue
-            if isinstance(_c, OpenAI):
-                if model in MODELS_OPENAI:
-                    organization_type = _org
-                    languru_logger.debug(
-                        f"Organization type: '{organization_type}' of '{_model}'."
-                    )
-                    break
-            elif isinstance(_c, AzureOpenAI):
-                if model in MODELS_AZURE_OPENAI:
-                    organization_type = _org
-                    languru_logger.debug(
-                        f"Organization type: '{organization_type}' of '{_model}'."
-                    )
-                    break
-            elif hasattr(_c, "models") and hasattr(_c.models, "supported_models"):
-                if model in _c.models.supported_models:  # type: ignore
-                    organization_type = _org
-                    languru_logger.debug(
-                        f"Organization type: '{organization_type}' of '{_model}'."
-                    )
-                    break
+        organization_type = self._model_orgs.get(_model)
+        if organization_type is not None:
+            languru_logger.debug(
+                f"Organization type: '{organization_type}' of '{_model}'."
+            )
         return organization_type
 
+    def model_orgs_add(self, models: Sequence[Text], org: OrganizationType) -> None:
+        """Maps the supported models to the organization, the first org wins.
+
+        Each organization only registers its own supported models, so a bare
+        model name resolves to the organization actually serving it.
+        """
+
+        for m in models:
+            self._model_orgs.setdefault(m, org)
+
     def org_from_model(self, model: Text) -> Optional[OrganizationType]:
         """Returns the organization type based on the model name."""
 
@@ -374,6 +393,96 @@ class OpenaiClients(OpenaiModels, OpenaiDepends):
             )
         return _client
 
+    def open_async_openai_clients(self) -> None:
+        """Creates the async clients on a new shared connection pool.
+
+        Called on app startup, so the pool belongs to the running event loop.
+        The async clients are only created for the initialized sync clients.
+        """
+
+        if self._async_http_client is not None:
+            return
+        http_client = DefaultAsyncHttpxClient(limits=ASYNC_HTTP_CONNECTION_LIMITS)
+        if self._oai_client is not None:
+            self._async_oai_client = AsyncOpenAI(http_client=http_client)
+        if self._aoai_client is not None:
+            self._async_aoai_client = AsyncAzureOpenAI(
+                api_version="2024-02-01", http_client=http_client
+            )
+        self._async_http_client = http_client
+        self._preferred_clients.clear()
+        self._admission_controllers.clear()
+
+    async def aclose_async_openai_clients(self) -> None:
+        """Drops the async clients and closes their connection pool.
+
+        Called on app shutdown, the sync clients are preferred until the async
+        clients are opened again.
+        """
+
+        http_client = self._async_http_client
+        self._async_oai_client = None
+        self._async_aoai_client = None
+        self._async_http_client = None
+        self._preferred_clients.clear()
+        self._admission_controllers.clear()
+        if http_client is not None:
+            await http_client.aclose()
+
+    def org_to_async_openai_client(
+        self, org: Union[Text, "OrganizationType", Any]
+    ) -> Optional["AsyncOpenAI"]:
+        """Returns the async OpenAI client of the organization type if available.
+
+        Only OpenAI and Azure OpenAI have async clients, None is returned for
+        the other organizations, whose sync clients must be used instead.
+        """
+
+        if not isinstance(org, OrganizationType):
+            org = to_org_type(org)
+        if org == OrganizationType.OPENAI:
+            return self._async_oai_client
+        elif org == OrganizationType.AZURE:
+            return self._async_aoai_client
+        return None
+
+    def org_to_preferred_openai_client(
+        self, org: Union[Text, "OrganizationType", Any]
+    ) -> Union["OpenAI", "AsyncOpenAI"]:
+        """Returns the async client of the organization if any, else the sync one.
+
+        The resolution is cached per organization type, since the clients do not
+        change once initialized.
+        """
+
+        if not isinstance(org, OrganizationType):
+            org = to_org_type(org)
+        client = self._preferred_clients.get(org)
+        if client is None:
+            client = self.org_to_async_openai_client(org) or self.org_to_openai_client(
+                org
+            )
+            self._preferred_clients[org] = client
+        return client
+
+    def admission_controller(
+        self, org: Union[Text, "OrganizationType", Any], *, max_limit: int
+    ) -> AdmissionController:
+        """Returns the controller bounding the concurrent calls to the organization.
+
+        The controller is created with `max_limit` on first use, and dropped
+        when the async clients are opened or closed, so its condition is bound
+        to the running event loop.
+        """
+
+        if not isinstance(org, OrganizationType):
+            org = to_org_type(org)
+        controller = self._admission_controllers.get(org)
+        if controller is None:
+            controller = AdmissionController(max_limit)
+            self._admission_controllers[org] = controller
+        return controller
+
     def default_openai_client(self) -> "OpenAI":
         """Returns the default OpenAI client."""
 
@@ -386,13 +495,13 @@ class OpenaiClients(OpenaiModels, OpenaiDepends):
 openai_clients = OpenaiClients()
 
 
-def openai_client_from_model(
+def org_type_from_model(
     model: Text,
     *,
     org_type: Optional[OrganizationType] = None,
     openai_clients: OpenaiClients = openai_clients,
-) -> Tuple[OpenAI, OrganizationType, Text]:
-    """Returns the OpenAI client and the model name without organization type."""
+) -> Tuple[OrganizationType, Text]:
+    """Returns the organization type and the model name without organization type."""
 
     if org_type is None:
         org_type = openai_clients.org_from_model(model)
@@ -400,5 +509,19 @@ def openai_client_from_model(
         raise HTTPException(status_code=400, detail="Organization type not found.")
 
     model_without_org = openai_clients.model_strip_org(model, org_type)
+    return (org_type, model_without_org)
+
+
+def openai_client_from_model(
+    model: Text,
+    *,
+    org_type: Optional[OrganizationType] = None,
+    openai_clients: OpenaiClients = openai_clients,
+) -> Tuple[OpenAI, OrganizationType, Text]:
+    """Returns the OpenAI client and the model name without organization type."""
+
+    org_type, model_without_org = org_type_from_model(
+        model, org_type=org_type, openai_clients=openai_clients
+    )
     openai_client = openai_clients.org_to_openai_client(org_type)
     return (openai_client, org_type, model_without_org)
@@ -16,6 +16,8 @@ from pyassorted.asyncio.executor import run_func
 from languru.config import logger as languru_logger
 from languru.exceptions import NotFound
 from languru.resources.sql.openai.backend import OpenaiBackend
+from languru.server.config import ServerBaseSettings
+from languru.server.deps.common import app_settings
 from languru.server.deps.openai_backend import depends_openai_backend
 from languru.server.deps.openai_clients import openai_client_from_model, openai_clients
 from languru.server.utils.common import get_value_from_app
@@ -42,16 +44,24 @@ async def _retrieve_assistant(
     return assistant_retrieved
 
 
-async def _list_messages(
-    thread_id: Text, *, openai_backend: OpenaiBackend
-) -> List[ThreadsMessage]:
-    """List messages in a thread from the OpenAI backend."""
+async def _retrieve_assistant_and_list_messages(
+    assistant: Text,
+    thread_id: Text,
+    *,
+    openai_backend: OpenaiBackend,
+    messages_limit: Optional[int] = None,
+) -> Tuple[Assistant, List[ThreadsMessage]]:
+    """Retrieve an assistant and list the thread messages in a single backend call."""
 
-    messages = await run_func(
-        openai_backend.threads.messages.list,
-        thread_id=thread_id,
-    )
-    return messages
+    try:
+        return await run_func(
+            openai_backend.retrieve_assistant_and_list_messages,
+            assistant_id=assistant,
+            thread_id=thread_id,
+            messages_limit=messages_limit,
+        )
+    except NotFound:
+        raise HTTPException(status_code=404, detail="Assistant not found.")
 
 
 async def _create_thread(
@@ -74,6 +84,7 @@ async def depends_thread_id_run_messages_assistant_openai_client_backend(
         description="The parameters for creating a run.",
     ),
     openai_backend: OpenaiBackend = Depends(depends_openai_backend),
+    settings: ServerBaseSettings = Depends(app_settings),
 ) -> Tuple[Text, ThreadsRun, List[ThreadsMessage], Assistant, OpenAI, OpenaiBackend]:
     """Returns the thread ID, the OpenAI threads run, the OpenAI client, and the backend.
 
@@ -91,11 +102,11 @@ async def depends_thread_id_run_messages_assistant_openai_client_backend(
     )
 
     # Get the assistant and threads messages
-    assistant, messages = await asyncio.gather(
-        _retrieve_assistant(
-            run_create_request.assistant_id, openai_backend=openai_backend
-        ),
-        _list_messages(thread_id, openai_backend=openai_backend),
+    assistant, messages = await _retrieve_assistant_and_list_messages(
+        run_create_request.assistant_id,
+        thread_id,
+        openai_backend=openai_backend,
+        messages_limit=settings.THREADS_RUN_MESSAGES_LIMIT,
     )
 
     # Retrieve the model if not specified
@@ -110,10 +121,10 @@ async def depends_thread_id_run_messages_assistant_openai_client_backend(
 
     # Append additional messages
     if run_create_request.additional_messages:
-        for m in run_create_request.additional_messages:
-            messages.append(
-                m.to_openai_message(thread_id=thread_id, status="completed")
-            )
+        messages.extend(
+            m.to_openai_message(thread_id=thread_id, status="completed")
+            for m in run_create_request.additional_messages
+        )
 
     # Create the OpenAI threads run
     run = run_create_request.to_openai_run(
@@ -0,0 +1,108 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, TypeVar
+
+from openai import RateLimitError
+
+T = TypeVar("T")
+
+
+class AdmissionSlot:
+    """An acquired slot of an `AdmissionController`, released exactly once.
+
+    A slot used as `async with controller.slot()` is released when the block
+    exits, unless `hold` handed it over to a stream which releases it once
+    the stream is exhausted or closed.
+    """
+
+    def __init__(self, controller: "AdmissionController"):
+        self._controller = controller
+        self._detached = False
+        self._released = False
+
+    @property
+    def detached(self) -> bool:
+        return self._detached
+
+    async def release(self, *, rate_limited: bool = False) -> None:
+        if self._released:
+            return
+        self._released = True
+        await self._controller._release(rate_limited=rate_limited)
+
+    def hold(self, iterator: AsyncIterator[T]) -> AsyncIterator[T]:
+        """Keep the slot until `iterator` is exhausted or closed."""
+
+        self._detached = True
+        return self._iterate(iterator)
+
+    async def _iterate(self, iterator: AsyncIterator[T]) -> AsyncIterator[T]:
+        rate_limited = False
+        try:
+            async for item in iterator:
+                yield item
+        except RateLimitError:
+            rate_limited = True
+            raise
+        finally:
+            await self.release(rate_limited=rate_limited)
+
+
+class AdmissionController:
+    """Bound the in-flight upstream calls with an `asyncio.Condition` counter.
+
+    The limit halves on rate limit errors and grows back by one slot after
+    `limit` consecutive successful calls, up to `max_limit`. Unlike a
+    semaphore, the limit can be resized while calls are waiting.
+    """
+
+    def __init__(self, max_limit: int = 64, *, min_limit: int = 1):
+        if min_limit < 1 or max_limit < min_limit:
+            raise ValueError(
+                f"Invalid limits: min_limit={min_limit}, max_limit={max_limit}"
+            )
+        self.max_limit = max_limit
+        self.min_limit = min_limit
+        self.limit = max_limit
+        self.in_flight = 0
+        self._successes = 0
+        self._condition = asyncio.Condition()
+
+    async def resize(self, limit: int) -> None:
+        async with self._condition:
+            self.limit = max(self.min_limit, min(limit, self.max_limit))
+            self._successes = 0
+            self._condition.notify_all()
+
+    async def acquire(self) -> AdmissionSlot:
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight < self.limit)
+            self.in_flight += 1
+        return AdmissionSlot(self)
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[AdmissionSlot]:
+        acquired = await self.acquire()
+        try:
+            yield acquired
+        except RateLimitError:
+            await acquired.release(rate_limited=True)
+            raise
+        except BaseException:
+            await acquired.release()
+            raise
+        if not acquired.detached:
+            await acquired.release()
+
+    async def _release(self, *, rate_limited: bool = False) -> None:
+        async with self._condition:
+            self.in_flight -= 1
+            if rate_limited:
+                self.limit = max(self.min_limit, self.limit // 2)
+                self._successes = 0
+            else:
+                self._successes += 1
+                if self._successes >= self.limit and self.limit < self.max_limit:
+                    self.limit += 1
+                    self._successes = 0
+            self._condition.notify_all()
@@ -0,0 +1,35 @@
+from typing import Any, Mapping, Optional, Text
+
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
+
+
+class SSEStreamingResponse(StreamingResponse):
+    """Streaming response for already encoded Server-Sent Events.
+
+    Sends the `text/event-stream` media type with the headers that keep
+    reverse proxies from caching or buffering the token stream. Unlike
+    sse-starlette's `EventSourceResponse`, no keep-alive pings are sent.
+    """
+
+    media_type = "text/event-stream"
+    DEFAULT_HEADERS: Mapping[Text, Text] = {
+        "Cache-Control": "no-cache",
+        "X-Accel-Buffering": "no",
+    }
+
+    def __init__(
+        self,
+        content: Any,
+        status_code: int = 200,
+        headers: Optional[Mapping[Text, Text]] = None,
+        media_type: Optional[Text] = None,
+        background: Optional[BackgroundTask] = None,
+    ) -> None:
+        super().__init__(
+            content,
+            status_code=status_code,
+            headers={**self.DEFAULT_HEADERS, **(headers or {})},
+            media_type=media_type,
+            background=background,
+        )
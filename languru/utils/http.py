@@ -1,8 +1,23 @@
-import json
+import asyncio
+import contextlib
 import logging
-from typing import Any, Dict, Generator, Iterable, List, Literal, Optional, Text, Union
+import math
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterable,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Text,
+    Union,
+)
 
 import httpx
+import orjson
 from pydantic import BaseModel
 
 from languru.config import logger as languru_logger
@@ -14,9 +29,13 @@ async def requests_stream_lines(
     method: Literal["POST", "GET"] = "POST",
     headers: Optional[Dict[Text, Text]] = None,
 ):
+    # Encode the payload with orjson instead of letting httpx use stdlib json
+    content = orjson.dumps(data) if data is not None else None
+    if content is not None:
+        headers = {"Content-Type": "application/json", **(headers or {})}
     async with httpx.AsyncClient(timeout=30) as client:
         async with client.stream(
-            method, str(url), json=data, headers=headers or None
+            method, str(url), content=content, headers=headers or None
         ) as response:
             async for chunk in response.aiter_lines():
                 yield chunk + "\n"
@@ -33,17 +52,131 @@ def simple_sse_encode(
     logger = logging.getLogger(logger) if isinstance(logger, Text) else logger
     has_warned = False
     for item in stream:
-        if isinstance(item, BaseModel):
-            yield f"data: {item.model_dump_json()}\n\n"
-        elif isinstance(item, (Dict, List)):
-            yield f"data: {json.dumps(item)}\n\n"
-        elif isinstance(item, Text):
-            yield f"data: {item}\n\n"
-        else:
+        encoded = _sse_encode_item(item)
+        if encoded is None:
             if has_warned is False:
                 logger.warning(
                     f"Unknown type {type(item)} in stream, using str() to encode."
                 )
                 has_warned = True
-            yield f"data: {str(item)}\n\n"
+            encoded = f"data: {str(item)}\n\n"
+        yield encoded
     yield "data: [DONE]\n\n"
+
+
+async def asimple_sse_encode(
+    stream: AsyncIterable[Union[Text, Dict, List[Any], BaseModel]],
+    logger: Optional[Union[Text, "logging.Logger"]] = None,
+) -> AsyncGenerator[Text, None]:
+    """Async counterpart of `simple_sse_encode`, iterating the stream natively."""
+
+    logger = logger or languru_logger
+    logger = logging.getLogger(logger) if isinstance(logger, Text) else logger
+    has_warned = False
+    async for item in stream:
+        encoded = _sse_encode_item(item)
+        if encoded is None:
+            if has_warned is False:
+                logger.warning(
+                    f"Unknown type {type(item)} in stream, using str() to encode."
+                )
+                has_warned = True
+            encoded = f"data: {str(item)}\n\n"
+        yield encoded
+    yield "data: [DONE]\n\n"
+
+
+def _sse_encode_item(item: Any) -> Optional[Text]:
+    if isinstance(item, BaseModel):
+        return f"data: {item.model_dump_json()}\n\n"
+    elif isinstance(item, (Dict, List)):
+        return f"data: {orjson.dumps(item).decode()}\n\n"
+    elif isinstance(item, Text):
+        return f"data: {item}\n\n"
+    return None
+
+
+async def acoalesce_sse_chunks(
+    stream: AsyncIterable[Text],
+    *,
+    max_size: int = 8192,
+    max_delay: float = 0.05,
+) -> AsyncGenerator[Text, None]:
+    """Join small encoded SSE frames into larger writes.
+
+    A frame arriving after `max_delay` seconds without a write, like the
+    first one, is written immediately. Frames arriving sooner are buffered
+    until `max_size` characters are collected or `max_delay` seconds have
+    passed since the last write, so token streams are written in fewer
+    chunks while the added latency stays bounded.
+
+    One task reads the stream into the buffer, so a frame costs a list append
+    and a write costs one future, instead of a task and a wait per frame.
+    The reader is awaited and the stream closed when the generator exits.
+    """
+
+    loop = asyncio.get_running_loop()
+    buffer: List[Text] = []
+    buffer_size = 0
+    exhausted = False
+    # Resolved by the reader or the timer to wake the writer up
+    wakeup: Optional["asyncio.Future[None]"] = None
+    # Resolved by the writer once the full buffer is flushed
+    drained: Optional["asyncio.Future[None]"] = None
+
+    def _resolve(future: Optional["asyncio.Future[None]"]) -> None:
+        if future is not None and not future.done():
+            future.set_result(None)
+
+    async def _read() -> None:
+        nonlocal buffer_size, exhausted, drained
+        try:
+            async for item in stream:
+                was_empty = not buffer
+                buffer.append(item)
+                buffer_size += len(item)
+                if buffer_size >= max_size:
+                    _resolve(wakeup)
+                    # Stop reading until the writer catches up
+                    drained = loop.create_future()
+                    await drained
+                elif was_empty:
+                    _resolve(wakeup)
+        finally:
+            exhausted = True
+            _resolve(wakeup)
+
+    reader = asyncio.ensure_future(_read())
+    last_write = -math.inf
+    try:
+        while True:
+            if not buffer:
+                if exhausted:
+                    break
+                wakeup = loop.create_future()
+                await wakeup
+                continue
+
+            delay = last_write + max_delay - loop.time()
+            if delay > 0 and buffer_size < max_size and not exhausted:
+                wakeup = loop.create_future()
+                timer = loop.call_later(delay, _resolve, wakeup)
+                try:
+                    await wakeup
+                finally:
+                    timer.cancel()
+
+            chunk = "".join(buffer)
+            buffer.clear()
+            buffer_size = 0
+            _resolve(drained)
+            yield chunk
+            last_write = loop.time()
+        reader.result()  # Raise the error of the stream if any
+    finally:
+        reader.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await reader
+        aclose = getattr(stream, "aclose", None)
+        if aclose is not None:
+            await aclose()
@@ -12,6 +12,7 @@ from typing import (
     Optional,
     Sequence,
     Text,
+    Tuple,
     Union,
 )
 from xml.sax.saxutils import escape as xml_escape
@@ -218,47 +219,105 @@ def emb_from_base64(base64_str: Text, dtype: DTypeLike = np.float32) -> List[flo
     ).tolist()
 
 
-def embeddings_create_with_cache(
+def embedding_cache_key(input: Text, *, model: Text, dimensions: int) -> Text:
+    """Return a fixed length cache key for the embedding of an input text."""
+
+    return hashlib.blake2b(
+        f"{model}:{dimensions}:{input}".encode("utf-8"), digest_size=16
+    ).hexdigest()
+
+
+def _embeddings_lookup_with_cache(
     *,
-    input: Text | Sequence[Text],
+    input: Sequence[Text],
     model: Text,
     dimensions: int,
     openai_client: "OpenAI",
     cache: Optional["Cache"],
-) -> List[List[float]]:
-    if not input:
-        return []
+) -> Tuple[Dict[int, Text], List[Tuple[List[int], List[float]]]]:
+    """Return the cached base64 embeddings by index and the created ones.
 
-    _input = [input] if isinstance(input, Text) else list(input)
-    _output: List[Optional[List[float]]] = [None] * len(_input)
+    The created embeddings are paired with the indexes of every input sharing
+    the same cache key, so duplicated misses are requested once.
+    """
+
+    _keys = [
+        embedding_cache_key(_inp, model=model, dimensions=dimensions) for _inp in input
+    ]
+    _cached: Dict[int, Text] = {}
 
-    # Check cache existence
-    _cached_idx: List[int] = []
-    _uncached_idx: List[int] = []
+    # Check cache existence in one transaction
+    _uncached_keys_idx: Dict[Text, List[int]] = {}
     if cache is not None:
-        for i, _inp in enumerate(_input):
-            _cached_emb_base64: Optional[Text] = cache.get(_inp)  # type: ignore
-            if _cached_emb_base64 is not None:
-                logger.debug(f"Embedding cache hit for '{_inp[:24]}...'")
-                _output[i] = emb_from_base64(_cached_emb_base64)
-                _cached_idx.append(i)
-            else:
-                _uncached_idx.append(i)
+        with cache.transact():
+            for i, _key in enumerate(_keys):
+                if _key in _uncached_keys_idx:
+                    _uncached_keys_idx[_key].append(i)
+                    continue
+                _cached_emb_base64: Optional[Text] = cache.get(_key)  # type: ignore
+                if _cached_emb_base64 is None:
+                    # Fall back to the legacy raw text key and backfill the new key
+                    _cached_emb_base64 = cache.get(input[i])  # type: ignore
+                    if _cached_emb_base64 is not None:
+                        cache.set(_key, _cached_emb_base64)
+                if _cached_emb_base64 is not None:
+                    logger.debug(f"Embedding cache hit for '{input[i][:24]}...'")
+                    _cached[i] = _cached_emb_base64
+                else:
+                    _uncached_keys_idx[_key] = [i]
     else:
-        _uncached_idx = list(range(len(_input)))
+        for i, _key in enumerate(_keys):
+            _uncached_keys_idx.setdefault(_key, []).append(i)
 
-    # Get embeddings from OpenAI
-    if _uncached_idx:
+    # Get embeddings of the unique uncached inputs from OpenAI
+    _created: List[Tuple[List[int], List[float]]] = []
+    if _uncached_keys_idx:
+        _uncached_idx = [idx[0] for idx in _uncached_keys_idx.values()]
         _emb_res = openai_client.embeddings.create(
-            input=[_input[i] for i in _uncached_idx],
+            input=[input[i] for i in _uncached_idx],
             model=model,
             dimensions=dimensions,
         )
-        for i, emb in zip(_uncached_idx, _emb_res.data):
-            if cache is not None:
-                logger.debug(f"Caching embedding for '{_input[i][:24]}...'")
-                cache.set(_input[i], emb_to_base64(emb.embedding))
-            _output[i] = emb.embedding
+        if len(_emb_res.data) != len(_uncached_idx):
+            raise ValueError("Failed to get embeddings from the OpenAI API.")
+        if cache is not None:
+            with cache.transact():
+                for i, emb in zip(_uncached_idx, _emb_res.data):
+                    logger.debug(f"Caching embedding for '{input[i][:24]}...'")
+                    cache.set(_keys[i], emb_to_base64(emb.embedding))
+        _created = [
+            (idx, emb.embedding)
+            for idx, emb in zip(_uncached_keys_idx.values(), _emb_res.data)
+        ]
+
+    return (_cached, _created)
+
+
+def embeddings_create_with_cache(
+    *,
+    input: Text | Sequence[Text],
+    model: Text,
+    dimensions: int,
+    openai_client: "OpenAI",
+    cache: Optional["Cache"],
+) -> List[List[float]]:
+    if not input:
+        return []
+
+    _input = [input] if isinstance(input, Text) else list(input)
+    _output: List[Optional[List[float]]] = [None] * len(_input)
+    _cached, _created = _embeddings_lookup_with_cache(
+        input=_input,
+        model=model,
+        dimensions=dimensions,
+        openai_client=openai_client,
+        cache=cache,
+    )
+    for i, _emb_base64 in _cached.items():
+        _output[i] = emb_from_base64(_emb_base64)
+    for idx, embedding in _created:
+        for i in idx:
+            _output[i] = embedding
 
     # Check if any embeddings failed to be retrieved
     if any(e is None for e in _output):
@@ -266,6 +325,47 @@ def embeddings_create_with_cache(
     return _output  # type: ignore
 
 
+def embeddings_array_create_with_cache(
+    *,
+    input: Sequence[Text],
+    model: Text,
+    dimensions: int,
+    openai_client: "OpenAI",
+    cache: Optional["Cache"],
+) -> np.ndarray:
+    """Like `embeddings_create_with_cache`, but return one float32 (N, D) array.
+
+    Cached embeddings are decoded straight into the array rows, without
+    building a Python list per embedding.
+    """
+
+    _input = list(input)
+    _output = np.empty((len(_input), dimensions), dtype=np.float32)
+    if not _input:
+        return _output
+
+    _cached, _created = _embeddings_lookup_with_cache(
+        input=_input,
+        model=model,
+        dimensions=dimensions,
+        openai_client=openai_client,
+        cache=cache,
+    )
+    if _cached:
+        _cached_idx = list(_cached.keys())
+        _output[_cached_idx] = np.frombuffer(
+            b"".join(base64.b64decode(_cached[i]) for i in _cached_idx),
+            dtype=np.float32,
+        ).reshape(len(_cached_idx), dimensions)
+    if _created:
+        _created_idx = [idx for idx, _ in _created]
+        _created_emb = np.asarray([emb for _, emb in _created], dtype=np.float32)
+        for idx, row in zip(_created_idx, _created_emb):
+            _output[idx] = row
+
+    return _output
+
+
 def ensure_vector(
     query: Text | List[float],
     *,
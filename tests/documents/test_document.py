@@ -1,6 +1,6 @@
-import copy
+import asyncio
+import json
 from itertools import chain
-from pprint import pformat
 from typing import List
 
 import duckdb
@@ -31,9 +31,33 @@ openai_client = OpenAI()
 vo_client = VoyageOpenAI()
 
 
-def test_document_operations():
+class BinaryPoint(Point):
+    TABLE_NAME = "points_binary"
+    EMBEDDING_QUANTIZATION = "binary"
+
+
+class BinaryDocument(Document):
+    TABLE_NAME = "documents_binary"
+    POINT_TYPE = BinaryPoint
+
+
+@pytest.fixture(scope="module")
+def shared_conn():
     conn: "duckdb.DuckDBPyConnection" = duckdb.connect(":memory:")
+    Document.objects.touch(conn=conn, debug=True)
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def conn(shared_conn: "duckdb.DuckDBPyConnection"):
+    yield shared_conn
+    # Clear the rows instead of re-creating the tables for every test
+    for table_name in (Point.TABLE_NAME, Document.TABLE_NAME):
+        shared_conn.execute(f"DELETE FROM {table_name}")
 
+
+def test_document_operations(conn: "duckdb.DuckDBPyConnection"):
     docs = _create_docs(conn)
 
     # Get documents
@@ -64,10 +88,10 @@ def test_document_operations():
         conn=conn,
         debug=True,
     )
-    new_meta = copy.deepcopy(docs[0].metadata)
-    new_meta["written_by"] = "Languru"  # Merge strategy is update extra fields
+    # Merge strategy is update extra fields
+    new_meta = {**docs[0].metadata, "written_by": "Languru"}
     assert updated_doc.name == new_doc_name
-    assert pformat(updated_doc.metadata) == pformat(new_meta)
+    assert updated_doc.metadata == new_meta
 
     # Remove document
     Document.objects.remove(docs[0].document_id, conn=conn, debug=True)
@@ -80,9 +104,7 @@ def test_document_operations():
     )
 
 
-def test_point_operations():
-    conn: "duckdb.DuckDBPyConnection" = duckdb.connect(":memory:")
-
+def test_point_operations(conn: "duckdb.DuckDBPyConnection"):
     docs = _create_docs(conn)
     points = _create_points(docs, conn)
 
@@ -129,9 +151,7 @@ def test_point_operations():
         Point.objects.retrieve(points[0].point_id, conn=conn, debug=True)
 
 
-def test_document_search():
-    conn: "duckdb.DuckDBPyConnection" = duckdb.connect(":memory:")
-
+def test_document_search(conn: "duckdb.DuckDBPyConnection"):
     docs = _create_docs(conn)
     _create_points(docs, conn)
 
@@ -163,11 +183,52 @@ def test_document_search():
         search_results.matches[0].content_md5 == search_results.documents[0].content_md5
     )
 
+    # Lazy vector search
+    _points = list(
+        Document.objects.isearch_vector(
+            search_results.matches[0].embedding, conn=conn, top_k=2, rows_per_batch=1
+        )
+    )
+    assert len(_points) == 2
+    assert _points[0].point_id == search_results.matches[0].point_id
+    assert _points[0].relevance_score >= _points[1].relevance_score
 
-def test_documents_bulk_create():
+
+def test_document_search_binary_quantization():
     conn: "duckdb.DuckDBPyConnection" = duckdb.connect(":memory:")
-    Document.objects.touch(conn=conn, debug=True)
+    BinaryDocument.objects.touch(conn=conn, debug=True)
+
+    docs = BinaryDocument.objects.bulk_create(
+        [BinaryDocument.from_content(**_raw_doc) for _raw_doc in raw_docs],
+        conn=conn,
+        debug=True,
+    )
+    BinaryDocument.objects.documents_sync_points(
+        docs, conn=conn, openai_client=openai_client, debug=True
+    )
+    assert conn.execute(
+        f"SELECT count(*) FROM {BinaryPoint.TABLE_NAME} WHERE embedding_bits IS NULL"
+    ).fetchone() == (0,)
+
+    search_results = BinaryDocument.objects.search(
+        "Jupiter's 190 Year Old Storm",
+        conn=conn,
+        openai_client=openai_client,
+        with_documents=True,
+        top_k=2,
+        debug=True,
+    )
+    assert len(search_results.matches) == 2
+    assert (
+        search_results.matches[0].relevance_score
+        >= search_results.matches[1].relevance_score
+    )
+    assert {_pt.document_id for _pt in search_results.matches} == {
+        _doc.document_id for _doc in search_results.documents
+    }
+
 
+def test_documents_bulk_create(conn: "duckdb.DuckDBPyConnection"):
     docs = Document.objects.bulk_create(
         [Document.from_content(**_raw_doc) for _raw_doc in raw_docs],
         conn=conn,
@@ -193,10 +254,24 @@ def test_documents_bulk_create():
     assert search_results.documents
 
 
-def test_documents_sync_points():
-    conn: "duckdb.DuckDBPyConnection" = duckdb.connect(":memory:")
-    Document.objects.touch(conn=conn, debug=True)
+def test_documents_to_points_batch(conn: "duckdb.DuckDBPyConnection"):
+    docs = [Document.from_content(**_raw_doc) for _raw_doc in raw_docs]
+    batch = Document.to_points_batch(docs, openai_client=openai_client)
+
+    assert len(batch) == sum(len(_doc.to_document_cards()) for _doc in docs)
+    assert batch.embeddings.shape == (len(batch), Point.EMBEDDING_DIMENSIONS)
+    assert set(batch.document_ids) == {_doc.document_id for _doc in docs}
 
+    Point.objects.bulk_create_batch(batch, conn=conn, debug=True)
+    for _pt in batch:
+        _db_pt = Point.objects.retrieve(_pt.point_id, conn=conn, with_embedding=True)
+        assert _db_pt is not None
+        assert _db_pt.document_id == _pt.document_id
+        assert _db_pt.content_md5 == _pt.content_md5
+        assert len(_db_pt.embedding) == Point.EMBEDDING_DIMENSIONS
+
+
+def test_documents_sync_points(conn: "duckdb.DuckDBPyConnection"):
     _batch_docs = Document.objects.bulk_create(
         [Document.from_content(**_raw_doc) for _raw_doc in raw_docs],
         conn=conn,
@@ -224,6 +299,18 @@ def test_documents_sync_points():
     )
     assert len(search_results.matches) == len(raw_docs)
     assert len(search_results.documents) == len(raw_docs)
+
+    # Stale points
+    _doc = _batch_docs[0]
+    assert (
+        Point.objects.any_stale(_doc.document_id, _doc.content_md5, conn=conn) is False
+    )
+    assert Point.objects.any_stale(_doc.document_id, "outdated", conn=conn) is True
+    assert Point.objects.any_stale("doc_not_exists", "outdated", conn=conn) is None
+    _new_doc = Document.from_content(name="New", content="Not synced yet.")
+    assert Document.objects.documents_are_points_current(
+        [*_batch_docs, _new_doc], conn=conn, shard_size=1, debug=True
+    ) == [True] * len(_batch_docs) + [False]
     for _m, _d in zip(search_results.matches, search_results.documents):
         assert _m.document_id == _d.document_id
         assert _m.content_md5 == _d.content_md5
@@ -233,10 +320,56 @@ def test_documents_sync_points():
     )
 
 
-def _create_docs(conn: "duckdb.DuckDBPyConnection") -> List["Document"]:
-    # Touch table
-    Document.objects.touch(conn=conn, debug=True)
+def test_documents_legacy_content_md5(conn: "duckdb.DuckDBPyConnection"):
+    # Insert the rows with the MD5 digest, as written before BLAKE2b
+    doc = Document.from_content(**raw_docs[0])
+    legacy_md5 = doc.content_md5 = Document.legacy_hash_content(doc.content)
+    conn.execute(
+        f"INSERT INTO {Document.TABLE_NAME} "
+        + "(document_id, name, content, content_md5, metadata, created_at, updated_at) "
+        + "VALUES (?, ?, ?, ?, ?, ?, ?)",
+        [
+            doc.document_id,
+            doc.name,
+            doc.content,
+            legacy_md5,
+            json.dumps(doc.metadata),
+            doc.created_at,
+            doc.updated_at,
+        ],
+    )
+    Point.objects.bulk_create(
+        Document.objects.documents_to_points([doc], openai_client=openai_client)[0],
+        conn=conn,
+        debug=True,
+    )
 
+    # Legacy digests are kept by strip, so the points stay current after sync
+    _doc = Document.objects.retrieve(doc.document_id, conn=conn)
+    assert _doc is not None
+    Document.objects.documents_sync_points(
+        [_doc], conn=conn, openai_client=openai_client
+    )
+    assert _doc.content_md5 == legacy_md5
+    _doc = Document.objects.retrieve(doc.document_id, conn=conn)
+    assert _doc is not None
+    assert _doc.are_points_current(conn=conn)
+    assert Document.objects.documents_are_points_current([_doc], conn=conn) == [True]
+
+
+def test_document_ahash_content():
+    for _content in (
+        raw_docs[0]["content"],
+        "x" * Document.HASH_CONTENT_THREAD_THRESHOLD,
+    ):
+        assert asyncio.run(Document.ahash_content(_content)) == Document.hash_content(
+            _content
+        )
+    doc = asyncio.run(Document.afrom_content(**raw_docs[0]))
+    assert doc.content_md5 == Document.from_content(**raw_docs[0]).content_md5
+
+
+def _create_docs(conn: "duckdb.DuckDBPyConnection") -> List["Document"]:
     # Create documents
     docs: List["Document"] = []
     for _raw_doc in raw_docs:
@@ -250,10 +383,11 @@ def _create_docs(conn: "duckdb.DuckDBPyConnection") -> List["Document"]:
 def _create_points(
     docs: List["Document"], conn: "duckdb.DuckDBPyConnection"
 ) -> List["Point"]:
-    # Create points
-    points: List["Point"] = []
-    for _doc in docs:
-        for _pt in _doc.to_points(openai_client=openai_client):
-            points.append(_pt)
-            Point.objects.create(_pt, conn=conn, debug=True)
+    # Embed all documents together and create points in a single insert
+    points: List["Point"] = list(
+        chain.from_iterable(
+            Document.objects.documents_to_points(docs, openai_client=openai_client)
+        )
+    )
+    Point.objects.bulk_create(points, conn=conn, debug=True)
     return points
@@ -5,7 +5,7 @@ import pytest
 from pydantic import EmailStr, Field
 
 from languru.models import DataModel
-from languru.openai_plugins.clients.google import GoogleOpenAI
+from languru.openai_plugins.clients.google import AsyncGoogleOpenAI, GoogleOpenAI
 
 client = GoogleOpenAI()
 model_name = "models/gemini-1.5-flash"
@@ -116,3 +116,16 @@ def test_model_from_openai(content, expected):
     res = User.model_from_openai(content, client, model=model_name, verbose=True)
     assert len(res) > 0
     assert all([isinstance(i, User) for i in res])
+
+
+def test_batch_model_from_openai():
+    contents = [
+        "Name: John Doe, Email: johndoe@example.com, Age: 34",
+        "Name: Jane Roe, Email: janeroe@example.com, Address: 1 Main St, Anytown",
+    ]
+    res = User.batch_model_from_openai(
+        contents, AsyncGoogleOpenAI(), model=model_name, concurrency=2
+    )
+    assert len(res) == len(contents)
+    assert all(len(_models) > 0 for _models in res)
+    assert all(isinstance(i, User) for _models in res for i in _models)
@@ -116,6 +116,38 @@ def test_openai_backend_threads_messages_apis(session_id_fixture: Text):
         openai_backend.threads.messages.retrieve(message_id, thread_id=thread_id)
 
 
+def test_openai_backend_retrieve_assistant_and_list_messages(
+    session_id_fixture: Text,
+):
+    openai_backend = OpenaiBackend(url="sqlite:///:memory:")
+    openai_backend.touch()
+
+    assistant_id = rand_openai_id("asst")
+    openai_backend.assistants.create(
+        Assistant.model_validate(get_dummy_assistant(assistant_id))
+    )
+    thread_id = rand_openai_id("thread")
+    openai_backend.threads.create(get_dummy_thread(thread_id))
+    message_id = rand_openai_id("message")
+    openai_backend.threads.messages.create(
+        get_dummy_message(message_id, thread_id=thread_id)
+    )
+
+    assistant, messages = openai_backend.retrieve_assistant_and_list_messages(
+        assistant_id, thread_id
+    )
+    assert assistant.id == assistant_id
+    assert [m.id for m in messages] == [message_id]
+    _, messages = openai_backend.retrieve_assistant_and_list_messages(
+        assistant_id, thread_id, messages_limit=0
+    )
+    assert messages == []
+    with pytest.raises(NotFound):
+        openai_backend.retrieve_assistant_and_list_messages(
+            rand_openai_id("asst"), thread_id
+        )
+
+
 def test_openai_backend_threads_runs_apis(session_id_fixture: Text):
     openai_backend = OpenaiBackend(url="sqlite:///:memory:")
     openai_backend.touch()
@@ -0,0 +1,43 @@
+import asyncio
+
+from languru.server.deps.openai_clients import OpenaiClients
+from languru.types.models import MODELS_ANTHROPIC, MODELS_OPENAI
+from languru.types.organizations import OrganizationType
+
+
+def test_org_from_bare_model_name(monkeypatch):
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "x")
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    monkeypatch.delenv("AZURE_OPENAI_API_KEY", raising=False)
+
+    openai_clients = OpenaiClients()
+    assert openai_clients._oai_client is None
+
+    # Bare model names resolve to the organization supporting them
+    assert openai_clients.org_from_model(MODELS_ANTHROPIC[0]) == (
+        OrganizationType.ANTHROPIC
+    )
+    # OpenAI models are not routed to another organization's client
+    assert openai_clients.org_from_model(MODELS_OPENAI[0]) is None
+
+
+def test_admission_controller_per_org(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "x")
+
+    async def run():
+        openai_clients = OpenaiClients()
+        openai_clients.open_async_openai_clients()
+        controller = openai_clients.admission_controller(
+            OrganizationType.OPENAI, max_limit=8
+        )
+        assert controller.max_limit == 8
+        assert openai_clients.admission_controller("openai", max_limit=8) is controller
+
+        # Controllers do not outlive the async clients and their event loop
+        await openai_clients.aclose_async_openai_clients()
+        assert (
+            openai_clients.admission_controller(OrganizationType.OPENAI, max_limit=8)
+            is not controller
+        )
+
+    asyncio.run(run())
@@ -0,0 +1,23 @@
+from fastapi.testclient import TestClient
+
+
+def test_app_lifespan_async_http_client(monkeypatch):
+    import languru.server.build
+    from languru.server.build import create_app
+    from languru.server.config import ServerBaseSettings
+    from languru.server.deps.openai_clients import OpenaiClients
+
+    # The async clients are only opened for the initialized sync clients
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-dummy")
+    openai_clients = OpenaiClients()
+    monkeypatch.setattr(languru.server.build, "openai_clients", openai_clients)
+
+    with TestClient(create_app(settings=ServerBaseSettings())):
+        http_client = openai_clients._async_http_client
+        assert http_client is not None
+        assert openai_clients._async_oai_client is not None
+
+    # The pool is closed with the app and not reused by the next lifespan
+    assert http_client.is_closed
+    assert openai_clients._async_http_client is None
+    assert openai_clients._async_oai_client is None
@@ -0,0 +1,93 @@
+import asyncio
+
+import httpx
+import pytest
+from openai import RateLimitError
+
+from languru.server.utils.admission import AdmissionController
+
+
+def _rate_limit_error() -> RateLimitError:
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+    return RateLimitError(
+        "Rate limited", response=httpx.Response(429, request=request), body=None
+    )
+
+
+def test_admission_controller_bounds_in_flight_calls():
+    async def run():
+        controller = AdmissionController(2)
+        peak = 0
+
+        async def call():
+            nonlocal peak
+            async with controller.slot():
+                peak = max(peak, controller.in_flight)
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*(call() for _ in range(8)))
+        assert peak == 2
+        assert controller.in_flight == 0
+
+    asyncio.run(run())
+
+
+def test_admission_controller_backs_off_and_ramps_up():
+    async def run():
+        controller = AdmissionController(4)
+
+        # Rate limit errors halve the limit
+        for expected_limit in (2, 1, 1):
+            with pytest.raises(RateLimitError):
+                async with controller.slot():
+                    raise _rate_limit_error()
+            assert controller.limit == expected_limit
+
+        # Successes grow it back one slot at a time
+        async with controller.slot():
+            pass
+        assert controller.limit == 2
+
+        await controller.resize(100)
+        assert controller.limit == controller.max_limit
+
+    asyncio.run(run())
+
+
+def test_admission_controller_held_stream_blocks_next_call():
+    async def run():
+        controller = AdmissionController(1)
+
+        async def stream():
+            for chunk in ("a", "b"):
+                yield chunk
+
+        async with controller.slot() as slot:
+            body = slot.hold(stream())
+
+        # The slot outlives the block until the stream is consumed
+        assert controller.in_flight == 1
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(controller.acquire(), timeout=0.05)
+
+        assert [chunk async for chunk in body] == ["a", "b"]
+        assert controller.in_flight == 0
+        await asyncio.wait_for(controller.acquire(), timeout=0.05)
+
+    asyncio.run(run())
+
+
+def test_admission_slot_released_once_when_stream_never_starts():
+    async def run():
+        controller = AdmissionController(1)
+
+        async def stream():
+            yield "a"
+
+        async with controller.slot() as slot:
+            slot.hold(stream())
+        await slot.release()
+        await slot.release()
+        assert controller.in_flight == 0
+
+    asyncio.run(run())
@@ -0,0 +1,106 @@
+import asyncio
+
+import pytest
+
+from languru.utils.http import acoalesce_sse_chunks
+
+
+async def _frames(count: int, delay: float = 0.0):
+    for i in range(count):
+        await asyncio.sleep(delay)  # Like awaiting the upstream response
+        yield f"data: {i}\n\n"
+
+
+async def _collect(stream):
+    return [chunk async for chunk in stream]
+
+
+def test_acoalesce_sse_chunks():
+    frames = [f"data: {i}\n\n" for i in range(10)]
+
+    # The first frame is written at once, the following fast frames are joined
+    chunks = asyncio.run(_collect(acoalesce_sse_chunks(_frames(10), max_delay=1.0)))
+    assert chunks == [frames[0], "".join(frames[1:])]
+
+    # The size limit splits the writes
+    chunks = asyncio.run(
+        _collect(acoalesce_sse_chunks(_frames(10), max_size=len(frames[0]) * 4))
+    )
+    assert chunks == [
+        frames[0],
+        "".join(frames[1:5]),
+        "".join(frames[5:9]),
+        "".join(frames[9:]),
+    ]
+
+    # Slow frames are written as they arrive
+    chunks = asyncio.run(
+        _collect(acoalesce_sse_chunks(_frames(3, delay=0.05), max_delay=0.01))
+    )
+    assert chunks == frames[:3]
+
+
+def test_acoalesce_sse_chunks_first_frame_not_delayed():
+    async def stream():
+        yield "data: 0\n\n"
+        await asyncio.sleep(10)
+        yield "data: 1\n\n"
+
+    async def run():
+        chunks = acoalesce_sse_chunks(stream(), max_delay=5.0)
+        first = await asyncio.wait_for(chunks.__anext__(), timeout=0.5)
+        await chunks.aclose()
+        return first
+
+    assert asyncio.run(run()) == "data: 0\n\n"
+
+
+def test_acoalesce_sse_chunks_stalled_stream():
+    async def stream():
+        for i in range(2):
+            await asyncio.sleep(0)
+            yield f"data: {i}\n\n"
+        await asyncio.sleep(10)
+        raise RuntimeError("Upstream closed")
+
+    async def run():
+        chunks = acoalesce_sse_chunks(stream(), max_delay=0.05)
+        first = await asyncio.wait_for(chunks.__anext__(), timeout=0.5)
+        # The buffered frame is flushed on time while the stream stalls
+        second = await asyncio.wait_for(chunks.__anext__(), timeout=0.5)
+        await chunks.aclose()
+        return [first, second]
+
+    assert asyncio.run(run()) == ["data: 0\n\n", "data: 1\n\n"]
+
+
+def test_acoalesce_sse_chunks_raises_stream_error():
+    async def stream():
+        await asyncio.sleep(0)
+        yield "data: 0\n\n"
+        raise RuntimeError("Upstream closed")
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(_collect(acoalesce_sse_chunks(stream())))
+
+
+def test_acoalesce_sse_chunks_closes_stream():
+    closed = []
+
+    async def stream():
+        try:
+            yield "data: 0\n\n"
+            await asyncio.sleep(10)
+            yield "data: 1\n\n"
+        finally:
+            closed.append(True)
+
+    async def run():
+        chunks = acoalesce_sse_chunks(stream(), max_delay=5.0)
+        await asyncio.wait_for(chunks.__anext__(), timeout=0.5)
+        await chunks.aclose()
+        # The reader has finished, no task is left pending
+        assert len(asyncio.all_tasks()) == 1
+
+    asyncio.run(run())
+    assert closed == [True]
@@ -0,0 +1,75 @@
+from types import SimpleNamespace
+from typing import List, Text
+
+import numpy as np
+from diskcache import Cache
+
+from languru.utils.openai_utils import (
+    emb_to_base64,
+    embedding_cache_key,
+    embeddings_array_create_with_cache,
+    embeddings_create_with_cache,
+)
+
+
+class FakeEmbeddings:
+    def __init__(self):
+        self.inputs: List[List[Text]] = []
+
+    def create(self, *, input: List[Text], model: Text, dimensions: int, **kwargs):
+        self.inputs.append(list(input))
+        return SimpleNamespace(
+            data=[
+                SimpleNamespace(embedding=[float(len(_inp))] * dimensions)
+                for _inp in input
+            ]
+        )
+
+
+def test_embeddings_create_with_cache(tmp_path):
+    client = SimpleNamespace(embeddings=FakeEmbeddings())
+    cache = Cache(directory=str(tmp_path))
+    kwargs = dict(model="m", dimensions=4, openai_client=client, cache=cache)
+
+    # Duplicated misses are sent once and scattered back in order
+    out = embeddings_create_with_cache(input=["a", "bb", "a"], **kwargs)
+    assert out == [[1.0] * 4, [2.0] * 4, [1.0] * 4]
+    assert client.embeddings.inputs == [["a", "bb"]]
+
+    # Only the uncached inputs are requested
+    out = embeddings_create_with_cache(input=["bb", "ccc"], **kwargs)
+    assert out == [[2.0] * 4, [3.0] * 4]
+    assert client.embeddings.inputs[-1] == ["ccc"]
+
+    # No request when every input is cached
+    embeddings_create_with_cache(input=["a", "ccc"], **kwargs)
+    assert len(client.embeddings.inputs) == 2
+    cache.close()
+
+
+def test_embeddings_create_with_cache_legacy_keys(tmp_path):
+    client = SimpleNamespace(embeddings=FakeEmbeddings())
+    cache = Cache(directory=str(tmp_path))
+    kwargs = dict(model="m", dimensions=4, openai_client=client, cache=cache)
+
+    # Embeddings cached under the legacy raw text key are reused and backfilled
+    cache.set("legacy", emb_to_base64([7.0] * 4))
+    out = embeddings_create_with_cache(input=["legacy"], **kwargs)
+    assert out == [[7.0] * 4]
+    assert client.embeddings.inputs == []
+    assert cache.get(embedding_cache_key("legacy", model="m", dimensions=4))
+    cache.close()
+
+
+def test_embeddings_array_create_with_cache(tmp_path):
+    client = SimpleNamespace(embeddings=FakeEmbeddings())
+    cache = Cache(directory=str(tmp_path))
+    kwargs = dict(model="m", dimensions=3, openai_client=client, cache=cache)
+
+    embeddings_create_with_cache(input=["a"], **kwargs)
+    out = embeddings_array_create_with_cache(input=["bb", "a", "bb"], **kwargs)
+    assert out.dtype == np.float32
+    assert out.tolist() == [[2.0] * 3, [1.0] * 3, [2.0] * 3]
+    assert client.embeddings.inputs == [["a"], ["bb"]]
+    assert embeddings_array_create_with_cache(input=[], **kwargs).shape == (0, 3)
+    cache.close()